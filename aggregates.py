@@ -0,0 +1,147 @@
+import threading
+
+import pandas as pd
+
+from perf import cache_lookup, stage
+
+STATUSES = ["Completed", "In Progress", "Not Started"]
+
+# Dimensions of the count cube, as col_map keys
+CUBE_FIELDS = ("pillar", "owner", "status")
+
+
+def _clean(value):
+    return None if pd.isna(value) else value
+
+
+def cube_counts(df, col_map):
+    """Count rows per (pillar, owner, status); missing values and columns become None"""
+    if df.empty:
+        return {}
+    dims = [
+        df[col_map[f]] if f in col_map else pd.Series(None, index=df.index, dtype=object)
+        for f in CUBE_FIELDS
+    ]
+    grouped = pd.concat(dims, axis=1, keys=CUBE_FIELDS).groupby(list(CUBE_FIELDS), dropna=False, observed=True).size()
+    return {tuple(_clean(v) for v in key): int(n) for key, n in grouped.items()}
+
+
+def selection_key(pillars=None, statuses=None, owners=None):
+    """Hashable filter key in CUBE_FIELDS order; None or an empty selection means 'no filter'"""
+    return tuple(frozenset(values) if values else None for values in (pillars, owners, statuses))
+
+
+class AggregateEngine:
+    """Immutable pillar x owner x status cube that answers every dashboard aggregate by slicing"""
+
+    def __init__(self, cube):
+        self.cube = dict(cube)
+        self._memo = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_frame(cls, df, col_map):
+        return cls(cube_counts(df, col_map))
+
+    def _memoized(self, name, key, build):
+        with self._lock:
+            cached = (name, key) in self._memo
+            if cached:
+                value = self._memo[(name, key)]
+        cache_lookup("aggregate", cached)
+        if cached:
+            return value
+        with stage("aggregate"):
+            value = build()
+        with self._lock:
+            self._memo[(name, key)] = value
+        return value
+
+    def select(self, pillars=None, statuses=None, owners=None):
+        """Cube cells matching a filter selection, as ((pillar, owner, status), count) pairs"""
+        key = selection_key(pillars, statuses, owners)
+
+        def build():
+            return tuple(
+                (cell, n) for cell, n in self.cube.items()
+                if all(allowed is None or value in allowed for value, allowed in zip(cell, key))
+            )
+        return self._memoized("select", key, build)
+
+    def _rollup(self, name, dims, key, **selection):
+        def build():
+            totals = {}
+            for cell, n in self.select(**selection):
+                group = tuple(cell[i] for i in dims)
+                totals[group] = totals.get(group, 0) + n
+            return totals
+        return self._memoized(name, key, build)
+
+    def total(self, **selection):
+        return sum(n for _, n in self.select(**selection))
+
+    def status_count(self, status, **selection):
+        key = selection_key(**selection)
+        return self._rollup("status", (2,), key, **selection).get((status,), 0)
+
+    def status_counts(self, **selection):
+        """Status / Count rows, largest first (value_counts order)"""
+        key = selection_key(**selection)
+        counts = self._rollup("status", (2,), key, **selection)
+        frame = pd.DataFrame([(s, n) for (s,), n in counts.items()], columns=["Status", "Count"]).astype({"Count": int})
+        return frame.sort_values("Count", ascending=False, kind="stable").reset_index(drop=True)
+
+    def _pairs(self, name, dims, label, **selection):
+        key = selection_key(**selection)
+        counts = self._rollup(name, dims, key, **selection)
+        rows = sorted((group + (n,) for group, n in counts.items() if None not in group),
+                      key=lambda r: (str(r[0]), str(r[1])))
+        return pd.DataFrame(rows, columns=[label, "Status", "Count"]).astype({"Count": int})
+
+    def pillar_status(self, **selection):
+        """Pillar / Status / Count rows (groupby order)"""
+        return self._pairs("pillar_status", (0, 2), "Pillar", **selection)
+
+    def owner_status(self, **selection):
+        """Owner / Status / Count rows (groupby order)"""
+        return self._pairs("owner_status", (1, 2), "Owner", **selection)
+
+    def pillar_summary(self, **selection):
+        """Strategic Pillars Summary table"""
+        pairs = self.pillar_status(**selection)
+        summary = (pairs.pivot(index="Pillar", columns="Status", values="Count")
+                   .reindex(columns=STATUSES).fillna(0).astype(int))
+        summary.index.name = "Strategic Pillar"
+        summary.columns.name = None
+        summary = summary.reset_index()
+        summary["Total"] = summary[STATUSES].sum(axis=1)
+        summary["% Completed"] = (summary["Completed"] / summary["Total"] * 100).round(1)
+        return summary[["Strategic Pillar", "Total", "Completed", "In Progress", "Not Started", "% Completed"]]
+
+
+# Engines for row-level filters (search) the cube can't answer, per (version, filter key)
+_filtered_engines = {}
+_filtered_lock = threading.Lock()
+MAX_FILTERED_ENGINES = 64
+
+
+def filtered_engine(version, filter_key, rows, col_map):
+    """AggregateEngine over an already filtered frame, memoized per data version and filter key"""
+    key = (version, filter_key)
+    with _filtered_lock:
+        engine = _filtered_engines.get(key)
+    cache_lookup("filtered_engine", engine is not None)
+    if engine is None:
+        with stage("aggregate"):
+            engine = AggregateEngine.from_frame(rows, col_map)
+        with _filtered_lock:
+            if len(_filtered_engines) >= MAX_FILTERED_ENGINES:
+                _filtered_engines.pop(next(iter(_filtered_engines)))
+            _filtered_engines[key] = engine
+    return engine
+
+
+def forget_version(version):
+    with _filtered_lock:
+        for key in [k for k in _filtered_engines if k[0] == version]:
+            del _filtered_engines[key]
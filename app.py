@@ -1,12 +1,25 @@
 
 import streamlit as st
 import pandas as pd
-import altair as alt
-from io import StringIO
-import gspread
-from google.oauth2.service_account import Credentials
+import numpy as np
 import time
 import os
+from sheets_client import sheet_id_from_url
+from fake_sheets import FAKE_SHEETS_DIR
+from sheets_gateway import gateway
+from sheet_cache import sheet_cache
+from refresh_scheduler import REFRESH_INTERVAL, watch_sheet
+from data_sources import (SUMMARY_WORKSHEET, TRACKER_WORKSHEET, CsvSource, GoogleSheetsSource, format_clock,
+                          normalize_columns, shared_tracker)
+from aggregates import filtered_engine, selection_key
+from filter_index import filter_index_for
+from search_index import search_index_for
+from owner_index import owner_index_for
+from table_pager import paginated_table
+from exports import export_button
+from charts import show_chart
+from portfolio_loader import SOURCE_COLUMN, load_portfolio, load_report, parse_sources
+from perf import finish_rerun, start_rerun
 
 # Configure page
 st.set_page_config(
@@ -16,115 +29,22 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Add caching for Google Sheets data to improve performance
-def load_google_sheet_cached(sheet_url, worksheet_name):
-    """Cached version of load_google_sheet for better performance"""
-    return load_google_sheet(sheet_url, worksheet_name)
+# Time each pipeline stage of this rerun (sidebar panel with ?perf=1, metrics file via env)
+start_rerun()
 
-def load_google_sheet(sheet_url, worksheet_name):
-    """Load data from Google Sheets with error handling"""
-    try:
-        # Set up credentials - try Streamlit secrets first, then local file
-        scope = ['https://spreadsheets.google.com/feeds', 'https://www.googleapis.com/auth/drive']
-        
-        # Try to get credentials from Streamlit secrets (for cloud deployment)
-        try:
-            import json
-            service_account_info = {
-                "type": st.secrets["gcp_service_account"]["type"],
-                "project_id": st.secrets["gcp_service_account"]["project_id"],
-                "private_key_id": st.secrets["gcp_service_account"]["private_key_id"],
-                "private_key": st.secrets["gcp_service_account"]["private_key"],
-                "client_email": st.secrets["gcp_service_account"]["client_email"],
-                "client_id": st.secrets["gcp_service_account"]["client_id"],
-                "auth_uri": st.secrets["gcp_service_account"]["auth_uri"],
-                "token_uri": st.secrets["gcp_service_account"]["token_uri"],
-                "auth_provider_x509_cert_url": st.secrets["gcp_service_account"]["auth_provider_x509_cert_url"],
-                "client_x509_cert_url": st.secrets["gcp_service_account"]["client_x509_cert_url"]
-            }
-            creds = Credentials.from_service_account_info(service_account_info, scopes=scope)
-            client = gspread.authorize(creds)
-        except:
-            # Fallback to local file (for local development)
-            if not os.path.exists('google-credentials.json'):
-                st.error("Google credentials not found in Streamlit secrets or local file.")
-                return None
-            
-            creds = Credentials.from_service_account_file('google-credentials.json', scopes=scope)
-            client = gspread.authorize(creds)
-        
-        # Extract sheet ID from URL
-        sheet_id = sheet_url.split('/d/')[1].split('/')[0]
-        
-        # Open the sheet
-        sheet = client.open_by_key(sheet_id)
-        
-        try:
-            worksheet = sheet.worksheet(worksheet_name)
-        except gspread.WorksheetNotFound:
-            st.error(f"Worksheet '{worksheet_name}' not found in the Google Sheet.")
-            return None
-        
-        # Special handling for Summary sheet to avoid duplicate column errors
-        if worksheet_name == "Summary":
-            # Get all values and manually process to avoid duplicate columns
-            all_values = worksheet.get_all_values()
-            
-            # Clean empty cells and ensure consistent structure
-            cleaned_values = []
-            max_cols = 0
-            
-            for row in all_values:
-                # Remove empty cells from the end
-                while row and row[-1] == '':
-                    row = row[:-1]
-                cleaned_values.append(row)
-                max_cols = max(max_cols, len(row))
-            
-            # Pad rows to ensure consistent column count
-            for i, row in enumerate(cleaned_values):
-                while len(row) < max_cols:
-                    row.append('')
-                cleaned_values[i] = row
-            
-            # Create DataFrame
-            df = pd.DataFrame(cleaned_values[1:], columns=cleaned_values[0])
-            
-            # Remove completely empty rows and columns
-            df = df.dropna(axis=1, how='all')
-            df = df.dropna(axis=0, how='all')
-            
-            # For Summary sheet, only keep the first two columns to avoid duplicates
-            if len(df.columns) >= 2:
-                df = df.iloc[:, :2]
-                df.columns = ['Summary Metric', 'Value']
-            
-        else:
-            # For other sheets, use standard method
-            all_records = worksheet.get_all_records()
-            df = pd.DataFrame(all_records)
-        
-        return df
-        
-    except Exception as e:
-        st.error(f"Error loading {worksheet_name}: {str(e)}")
-        st.write(f"Exception type: {type(e)}")
-        import traceback
-        st.write(f"Traceback: {traceback.format_exc()}")
-        return None
-
-@st.cache_data
-def load_csv(file):
-    if file is None:
-        return None
-    return pd.read_csv(file)
-
-@st.cache_data
-def load_csv_path(path):
-    try:
-        return pd.read_csv(path)
-    except Exception:
-        return None
+@st.fragment(run_every=REFRESH_INTERVAL)
+def auto_refresh_watcher(watched_sheet=None):
+    """Poll the shared refresh scheduler without blocking; rerun the app only when new data is ready"""
+    if watched_sheet is not None:
+        sheet_url, worksheet_names = watched_sheet
+        latest = watch_sheet(sheet_id_from_url(sheet_url), worksheet_names)
+    else:
+        # Local CSVs have no revision marker, so refresh on every tick
+        latest = int(time.time() // REFRESH_INTERVAL)
+    seen = st.session_state.get("refresh_seen")
+    st.session_state["refresh_seen"] = latest
+    if seen is not None and latest is not None and latest != seen:
+        st.rerun()
 
 st.title("📊 Progress Dashboard")
 st.caption("Built with Streamlit. Connect to Google Sheets for live updates or upload CSVs.")
@@ -144,8 +64,8 @@ with st.sidebar:
     auto_refresh = st.checkbox("🔄 Auto-refresh every 30 seconds", value=False)
     if auto_refresh:
         st.info("Auto-refresh enabled! Data will update automatically.")
-        time.sleep(30)  # Simple refresh mechanism
-        st.rerun()
+    watched_sheet = None
+    data_source_key, data_version = None, None
     
     if data_source == "📁 Local CSV Files":
         st.write("Upload CSVs **or** auto-load by filename in the app folder.")
@@ -163,9 +83,14 @@ with st.sidebar:
         """)
         
         # Load data (uploaded takes precedence; fallback to local filenames)
-        df1 = load_csv(up_df1) if up_df1 else (load_csv_path("JNG_GTM_Dashboard-Tracker.csv") if use_local else None)
-        df2 = load_csv(up_df2) if up_df2 else (load_csv_path("Book1.csv") if use_local else None)
-        df3 = load_csv(up_df3) if up_df3 else (load_csv_path("Book2.csv") if use_local else None)
+        source = CsvSource({
+            "tracker": up_df1 or ("JNG_GTM_Dashboard-Tracker.csv" if use_local else None),
+            "pillars": up_df2 or ("Book1.csv" if use_local else None),
+            "summary": up_df3 or ("Book2.csv" if use_local else None),
+        }, "tracker")
+        frames = source.load()
+        df1, df2, df3 = frames["tracker"], frames["pillars"], frames["summary"]
+        data_source_key, data_version = source.key, source.loaded_version()
         
     else:  # Google Sheets mode
         st.markdown("### ☁️ Google Sheets Setup")
@@ -179,6 +104,8 @@ with st.sidebar:
             # Fallback to local file check (for local development)
             if os.path.exists('google-credentials.json'):
                 st.success("✅ Google credentials found in local file!")
+            elif FAKE_SHEETS_DIR:
+                st.info(f"🧪 Using the local fake Sheets backend in `{FAKE_SHEETS_DIR}`")
             else:
                 st.error("❌ Google credentials not found!")
                 st.markdown("""
@@ -197,11 +124,30 @@ with st.sidebar:
                 help="Your Google Sheet URL (pre-filled with working sheet)"
             )
             
+            extra_sheets = st.text_area(
+                "➕ More tracker sheets (portfolio view):",
+                value="",
+                help="One Google Sheet URL per line, optionally as 'Label | URL'. Their tracker rows are merged with the sheet above and tagged by source."
+            )
+            
+            if st.button("🧹 Clear cached data", help="Drop cached worksheets and reload from Google Sheets"):
+                sheet_cache.invalidate()
+            
             if sheet_url:
                 with st.spinner("🔄 Loading data from Google Sheets..."):
-                    # Load both sheets: "JNG V2.0_GTM Dashboard" and "Summary"
-                    df1 = load_google_sheet_cached(sheet_url, "JNG V2.0_GTM Dashboard")  # Main tracker data
-                    df2 = load_google_sheet_cached(sheet_url, "Summary")    # Summary data
+                    # Load both sheets: "JNG V2.0_GTM Dashboard" and "Summary" in one batch,
+                    # re-downloading only when the sheet's revision marker has moved
+                    worksheet_names = [TRACKER_WORKSHEET, SUMMARY_WORKSHEET]
+                    source = GoogleSheetsSource(sheet_url, worksheet_names)
+                    if source.version() is not None:
+                        watched_sheet = (sheet_url, worksheet_names)
+                    frames = source.load() or {}
+                    # Key on the revision the frames came from: a warm-start or offline
+                    # snapshot can be older than the live sheet
+                    data_source_key, data_version = source.key, source.loaded_version()
+                    source.show_notices()
+                    df1 = frames.get(TRACKER_WORKSHEET)  # Main tracker data
+                    df2 = frames.get(SUMMARY_WORKSHEET)    # Summary data
                     df3 = df2  # Use df2 for summary metrics
                 
 
@@ -215,6 +161,29 @@ with st.sidebar:
                     st.success(f"✅ Successfully loaded Summary sheet with {len(df2)} rows")
                 else:
                     st.error("❌ Failed to load Summary sheet")
+                
+                portfolio = parse_sources(extra_sheets)
+                if portfolio and df1 is not None:
+                    # Other programs' trackers, fetched concurrently with per-sheet timeouts
+                    with st.spinner(f"🔄 Loading {len(portfolio)} more tracker sheets..."):
+                        merged, loads = load_portfolio(portfolio, TRACKER_WORKSHEET)
+                    main = normalize_columns(df1).assign(**{SOURCE_COLUMN: "Main"})
+                    df1 = pd.concat([main, merged], ignore_index=True, sort=False) if merged is not None else main
+                    df3 = None  # the Summary sheet only covers the main tracker
+                    data_source_key, data_version = ("portfolio", sheet_id_from_url(sheet_url), tuple(portfolio)), None
+                    failed = sum(l.status not in ("ok", "snapshot") for l in loads)
+                    st.info(f"📚 Portfolio: {len(df1)} rows from {len(loads) + 1 - failed} sheets"
+                            + (f" ({failed} failed)" if failed else ""))
+                    with st.expander("Portfolio load report"):
+                        st.dataframe(load_report(loads), use_container_width=True)
+                
+                sheet_state = source.state()
+                if sheet_state is not None:
+                    st.caption(f"🕒 Last changed: {format_clock(sheet_state.last_changed)} · "
+                               f"Last checked: {format_clock(sheet_state.last_checked)}")
+                api = gateway.stats()
+                st.caption(f"📶 Sheets API: {api['last_minute']}/{api['quota_per_minute']:.0f} requests this minute · "
+                           f"{api['coalesced']} coalesced · {api['retries']} retried")
                     
             else:
                 df1, df2, df3 = None, None, None
@@ -230,45 +199,26 @@ with st.sidebar:
             """)
             df1, df2, df3 = None, None, None
 
-# Minimal schema handling
-def normalize_columns(df):
-    if df is None:
-        return None
-    df.columns = [c.strip() for c in df.columns]
-    return df
+    if auto_refresh:
+        auto_refresh_watcher(watched_sheet)
 
-df1 = normalize_columns(df1)
 df2 = normalize_columns(df2)
 df3 = normalize_columns(df3)
 
-# If df1 exists, infer choices
-if df1 is not None:
-    # Try to standardize expected column names
-    col_map = {}
-    for c in df1.columns:
-        lc = c.lower()
-        if "strategic pillar" in lc or "pillar" in lc:
-            col_map["pillar"] = c
-        elif "kpi" in lc or "metric" in lc:
-            col_map["metric"] = c
-        elif "responsible" in lc or "owner" in lc:
-            col_map["owner"] = c
-        elif "status" in lc:
-            col_map["status"] = c
-        elif "frequency" in lc:
-            col_map["frequency"] = c
-        elif "tat" in lc or "target" in lc:
-            col_map["target"] = c
-        elif "action" in lc:
-            col_map["action"] = c
-
+# Filters and everything that depends on them rerun on their own: a filter change
+# re-executes only this fragment, not the loading, KPI and summary sections
+@st.fragment
+def tracker_view(df1, col_map, engine, filter_index, owner_index, version_key):
+    """Filters, charts and the detailed table for the filtered tracker rows"""
+    # A filter change reruns only this fragment: time it as a rerun of its own
+    start_rerun("fragment")
     # Build filter UI
     st.subheader("🔎 Filters")
     with st.expander("Show/Hide Filters", expanded=True):
         col1, col2, col3, col4 = st.columns(4)
-        pillar_vals = sorted(df1[col_map.get("pillar")].dropna().unique()) if "pillar" in col_map else []
-        status_vals = sorted(df1[col_map.get("status")].dropna().unique()) if "status" in col_map else []
-        owner_vals = sorted(df1[col_map.get("owner")].dropna().unique()) if "owner" in col_map else []
+        pillar_vals = filter_index.values("pillar")
+        status_vals = filter_index.values("status")
+        owner_vals = filter_index.values("owner")
         with col1:
             sel_pillars = st.multiselect("Strategic Pillar", options=pillar_vals, default=pillar_vals)
         with col2:
@@ -276,89 +226,48 @@ if df1 is not None:
         with col3:
             sel_owner = st.multiselect("Owner", options=owner_vals, default=owner_vals)
         with col4:
-            search = st.text_input("Search KPI / Metric (contains)", "")
-
-    # Apply filters
-    filt = pd.Series([True] * len(df1))
-    if "pillar" in col_map and sel_pillars:
-        filt &= df1[col_map["pillar"]].isin(sel_pillars)
-    if "status" in col_map and sel_status:
-        filt &= df1[col_map["status"]].isin(sel_status)
-    if "owner" in col_map and sel_owner:
-        filt &= df1[col_map["owner"]].isin(sel_owner)
-    if "metric" in col_map and search.strip():
-        filt &= df1[col_map["metric"]].astype(str).str.contains(search, case=False, na=False)
+            search = st.text_input("Search KPI / Metric (contains)", "",
+                                   help="Matches KPI / Metric and Action Items. All words must match; end a word with * for a prefix search.")
 
-    df1_f = df1[filt].copy()
+    # Apply filters: bitmap AND over the multiselects gives row positions, no frame copy
+    rows = filter_index.select(pillars=sel_pillars, statuses=sel_status, owners=sel_owner)
+    if "metric" in col_map and search.strip():
+        # Prebuilt trigram/token index; results are cached per query string
+        hits = search_index_for(version_key, df1, col_map).search(search)
+        rows = np.intersect1d(rows, hits, assume_unique=True)
 
-    # ---- KPI cards (from df3 if present else compute from df1) ----
-    st.subheader("📌 Summary KPIs")
-    if df3 is not None and set(["Summary Metric","Value"]).issubset(set(df3.columns)):
-        kpi_map = {row["Summary Metric"]: row["Value"] for _, row in df3.iterrows()}
-        total = int(kpi_map.get("Total Deliverables", len(df1)))
-        not_started = int(kpi_map.get("Not Started (count)", (df1[col_map["status"]]=="Not Started").sum() if "status" in col_map else 0))
-        in_progress = int(kpi_map.get("In Progress (count)", (df1[col_map["status"]]=="In Progress").sum() if "status" in col_map else 0))
-        completed = int(kpi_map.get("Completed (count)", (df1[col_map["status"]]=="Completed").sum() if "status" in col_map else 0))
-        pct_completed = float(kpi_map.get("% Completed", round(100*completed/total,1) if total else 0))
+    # Chart aggregates: slice the cube for the multiselects; a search needs the filtered rows.
+    # The cube is keyed by raw owner values, so selected owners expand to the values naming them
+    selection = dict(pillars=sel_pillars, statuses=sel_status, owners=owner_index.expand(sel_owner))
+    if "metric" in col_map and search.strip():
+        filter_key = (selection_key(**selection), search.strip().lower())
+        chart_engine, chart_selection = filtered_engine(version_key, filter_key, df1.iloc[rows], col_map), {}
     else:
-        # Compute from df1
-        total = len(df1)
-        not_started = int((df1[col_map["status"]]=="Not Started").sum()) if "status" in col_map else None
-        in_progress = int((df1[col_map["status"]]=="In Progress").sum()) if "status" in col_map else None
-        completed = int((df1[col_map["status"]]=="Completed").sum()) if "status" in col_map else None
-        pct_completed = round(100*completed/total,1) if total else 0
+        chart_engine, chart_selection = engine, selection
 
-    k1,k2,k3,k4,k5 = st.columns(5)
-    k1.metric("Total Deliverables", total)
-    k2.metric("Not Started", not_started)
-    k3.metric("In Progress", in_progress)
-    k4.metric("Completed", completed)
-    k5.metric("% Completed", pct_completed if pct_completed is not None else 0)
-
-    st.divider()
+    # Everything below that depends on the filters is cached under this key
+    view_key = (selection_key(pillars=sel_pillars, statuses=sel_status, owners=sel_owner), search.strip().lower())
 
     # ---- Charts ----
     st.subheader("📈 Status Distribution")
     if "status" in col_map:
         with st.spinner("Generating charts..."):
-            status_counts = df1_f[col_map["status"]].value_counts(dropna=False).rename_axis("Status").reset_index(name="Count")
-            chart1 = alt.Chart(status_counts).mark_bar().encode(
-                x=alt.X("Status:N", sort='-y'),
-                y="Count:Q",
-                tooltip=["Status:N","Count:Q"]
-            ).properties(height=300)
-            st.altair_chart(chart1, use_container_width=True)
+            # Specs are compiled once; only the aggregated data changes per filter
+            show_chart("status", lambda: chart_engine.status_counts(**chart_selection), version_key, view_key)
     else:
         st.info("Status column not found for chart.")
 
     st.subheader("🏛️ Status by Strategic Pillar")
     if "pillar" in col_map and "status" in col_map:
-        pivot = (df1_f.groupby([col_map["pillar"], col_map["status"]])
-                 .size().reset_index(name="Count")
-                 .rename(columns={col_map["pillar"]:"Pillar", col_map["status"]:"Status"}))
-        chart2 = alt.Chart(pivot).mark_bar().encode(
-            x=alt.X("Pillar:N", sort=alt.SortField(field="Pillar")),
-            y=alt.Y("Count:Q", stack="zero"),
-            color="Status:N",
-            tooltip=["Pillar:N","Status:N","Count:Q"]
-        ).properties(height=380)
-        st.altair_chart(chart2, use_container_width=True)
+        show_chart("pillar_status", lambda: chart_engine.pillar_status(**chart_selection), version_key, view_key)
     else:
         st.info("Need Pillar and Status columns for stacked bar.")
 
     # ---- Owner workload ----
     st.subheader("👤 Workload by Owner")
     if "owner" in col_map and "status" in col_map:
-        owner_counts = (df1_f.groupby([col_map["owner"], col_map["status"]])
-                        .size().reset_index(name="Count")
-                        .rename(columns={col_map["owner"]:"Owner", col_map["status"]:"Status"}))
-        chart3 = alt.Chart(owner_counts).mark_bar().encode(
-            x=alt.X("Owner:N", sort=alt.SortField(field="Owner")),
-            y=alt.Y("Count:Q", stack="zero"),
-            color="Status:N",
-            tooltip=["Owner:N","Status:N","Count:Q"]
-        ).properties(height=320)
-        st.altair_chart(chart3, use_container_width=True)
+        show_chart("owner_status", lambda: owner_index.workload(chart_engine.owner_status(**chart_selection), sel_owner),
+                   version_key, view_key)
     else:
         st.info("Owner column not found for chart.")
 
@@ -366,11 +275,57 @@ if df1 is not None:
 
     # ---- Detailed table ----
     st.subheader("📋 Detailed Tracker")
-    st.dataframe(df1_f, use_container_width=True)
+    # Sorted, paged and projected server-side; only the visible page is sent
+    paginated_table(df1, version_key, rows=rows, filter_key=view_key, key="tracker")
 
-    # Export filtered table
-    csv = df1_f.to_csv(index=False).encode("utf-8")
-    st.download_button("⬇️ Download filtered table as CSV", data=csv, file_name="filtered_tracker.csv", mime="text/csv")
+    # Export filtered table; the file is only built when asked for, then cached per filter
+    export_button("filtered table", lambda: df1.iloc[rows], version_key,
+                  filter_key=view_key, file_name="filtered_tracker", key="export_tracker")
+    finish_rerun("fragment")
+
+
+# If df1 exists, infer choices
+if df1 is not None:
+    # Shared pipeline (same as app_fast / app_super_fast): one read-only typed frame,
+    # column map and count cube per data version, refcounted by the sessions viewing it
+    tracker = shared_tracker(data_source_key, data_version, df1)
+    df1, col_map, engine, version_key = tracker.df, tracker.col_map, tracker.engine, tracker.version_key
+
+    # Combined "Who is Responsible" values ("MD,COO, Head Sourcing") exploded into
+    # an owner -> rows index, so owners are filtered and counted individually
+    owner_index = owner_index_for(version_key, df1, col_map)
+
+    # Codes and per-value bitmaps for the multiselects, built once per data version
+    filter_index = filter_index_for(version_key, df1, col_map, owner_index)
+
+    # ---- KPI cards (from df3 if present else compute from df1) ----
+    st.subheader("📌 Summary KPIs")
+    if df3 is not None and set(["Summary Metric","Value"]).issubset(set(df3.columns)):
+        kpi_map = {row["Summary Metric"]: row["Value"] for _, row in df3.iterrows()}
+        total = int(kpi_map.get("Total Deliverables", len(df1)))
+        not_started = int(kpi_map.get("Not Started (count)", engine.status_count("Not Started")))
+        in_progress = int(kpi_map.get("In Progress (count)", engine.status_count("In Progress")))
+        completed = int(kpi_map.get("Completed (count)", engine.status_count("Completed")))
+        pct_completed = float(kpi_map.get("% Completed", round(100*completed/total,1) if total else 0))
+    else:
+        # Compute from df1
+        total = len(df1)
+        not_started = engine.status_count("Not Started") if "status" in col_map else None
+        in_progress = engine.status_count("In Progress") if "status" in col_map else None
+        completed = engine.status_count("Completed") if "status" in col_map else None
+        pct_completed = round(100*completed/total,1) if total else 0
+
+    k1,k2,k3,k4,k5 = st.columns(5)
+    k1.metric("Total Deliverables", total)
+    k2.metric("Not Started", not_started)
+    k3.metric("In Progress", in_progress)
+    k4.metric("Completed", completed)
+    k5.metric("% Completed", pct_completed if pct_completed is not None else 0)
+
+    st.divider()
+
+    # Filters, charts and table (re-executed on their own when a filter changes)
+    tracker_view(df1, col_map, engine, filter_index, owner_index, version_key)
 
 else:
     st.warning("Could not find or load the main tracker CSV. Please upload it in the sidebar or place it next to app.py with the filename **JNG_GTM_Dashboard-Tracker.csv**.")
@@ -381,32 +336,16 @@ else:
 if df1 is not None and "pillar" in col_map:
     st.subheader("🏛️ Strategic Pillars Summary")
     
-    # Create summary by strategic pillar using a simpler approach
-    pillar_summary = df1.groupby(col_map["pillar"])[col_map["status"]].value_counts().unstack(fill_value=0).reset_index()
-    
-    # Ensure we have all status columns
-    if 'Completed' not in pillar_summary.columns:
-        pillar_summary['Completed'] = 0
-    if 'In Progress' not in pillar_summary.columns:
-        pillar_summary['In Progress'] = 0
-    if 'Not Started' not in pillar_summary.columns:
-        pillar_summary['Not Started'] = 0
-    
-    # Calculate totals and percentages
-    pillar_summary['Total'] = pillar_summary[['Completed', 'In Progress', 'Not Started']].sum(axis=1)
-    pillar_summary['% Completed'] = (pillar_summary['Completed'] / pillar_summary['Total'] * 100).round(1)
-    
-    # Rename the first column to "Strategic Pillar"
-    pillar_summary = pillar_summary.rename(columns={col_map["pillar"]: "Strategic Pillar"})
-    
-    # Reorder columns
-    pillar_summary = pillar_summary[["Strategic Pillar", "Total", "Completed", "In Progress", "Not Started", "% Completed"]]
+    # Strategic pillar summary is a slice of the same count cube
+    pillar_summary = engine.pillar_summary()
     
     # Display strategic pillars summary
     st.dataframe(pillar_summary, use_container_width=True)
     
     # Export strategic pillars summary
-    csv_pillars = pillar_summary.to_csv(index=False).encode("utf-8")
-    st.download_button("⬇️ Download Strategic Pillars Summary as CSV", data=csv_pillars, file_name="strategic_pillars_summary.csv", mime="text/csv")
+    export_button("Strategic Pillars Summary", lambda: pillar_summary, version_key,
+                  file_name="strategic_pillars_summary", key="export_pillars")
 
 st.caption("Tip: Use the sidebar to upload updated CSVs anytime.")
+
+finish_rerun()
@@ -1,9 +1,10 @@
 import streamlit as st
-import pandas as pd
-import altair as alt
-import gspread
-from google.oauth2.service_account import Credentials
 import os
+from fake_sheets import FAKE_SHEETS_DIR
+from data_sources import SUMMARY_WORKSHEET, TRACKER_WORKSHEET, GoogleSheetsSource, open_tracker
+from table_pager import paginated_table
+from charts import show_chart
+from perf import finish_rerun, start_rerun
 
 # Configure page for faster loading
 st.set_page_config(
@@ -13,28 +14,8 @@ st.set_page_config(
     initial_sidebar_state="collapsed"  # Collapsed for faster loading
 )
 
-# Add caching for better performance
-@st.cache_data(ttl=600)  # Cache for 10 minutes
-def load_google_sheet_fast(sheet_url, worksheet_name):
-    """Fast cached version of Google Sheets loading"""
-    try:
-        if not os.path.exists('google-credentials.json'):
-            return None
-        
-        scope = ['https://spreadsheets.google.com/feeds', 'https://www.googleapis.com/auth/drive']
-        creds = Credentials.from_service_account_file('google-credentials.json', scopes=scope)
-        client = gspread.authorize(creds)
-        
-        sheet_id = sheet_url.split('/')[5]
-        sheet = client.open_by_key(sheet_id)
-        worksheet = sheet.worksheet(worksheet_name)
-        
-        all_records = worksheet.get_all_records()
-        return pd.DataFrame(all_records)
-        
-    except Exception as e:
-        st.error(f"Error loading {worksheet_name}: {str(e)}")
-        return None
+# Time each pipeline stage of this rerun (sidebar panel with ?perf=1, metrics file via env)
+start_rerun()
 
 # Main app
 st.title("📊 Progress Dashboard")
@@ -48,29 +29,34 @@ with st.sidebar:
     sheet_url = st.text_input("🔗 Google Sheet URL", value=default_sheet_url)
 
 # Load data with loading indicator
-if sheet_url and os.path.exists('google-credentials.json'):
+if sheet_url and (os.path.exists('google-credentials.json') or FAKE_SHEETS_DIR):
     with st.spinner("🔄 Loading data..."):
-        df1 = load_google_sheet_fast(sheet_url, "JNG V2.0_GTM Dashboard")
-        df2 = load_google_sheet_fast(sheet_url, "Summary")
+        # Same cached, revision-aware pipeline as app.py; both worksheets in one batch
+        source = GoogleSheetsSource(sheet_url, [TRACKER_WORKSHEET, SUMMARY_WORKSHEET])
+        tracker, frames = open_tracker(source)
+        df2 = frames.get(SUMMARY_WORKSHEET)
+    source.show_notices()
     
-    if df1 is not None:
+    if tracker is not None:
+        df1 = tracker.df
         st.success(f"✅ Loaded {len(df1)} rows from Dashboard")
         
         # Quick summary metrics
         col1, col2, col3, col4 = st.columns(4)
         
-        # Find status column
-        status_col = None
-        for col in df1.columns:
-            if 'status' in col.lower():
-                status_col = col
-                break
+        # Status and pillar columns, resolved once per data version
+        status_col = tracker.col_map.get("status")
+        pillar_col = tracker.col_map.get("pillar")
+        
+        # One count cube answers the metrics, the chart and the pillar summary
+        engine = tracker.engine
+        frame_version = tracker.version_key
         
         if status_col:
             total = len(df1)
-            completed = len(df1[df1[status_col] == 'Completed'])
-            in_progress = len(df1[df1[status_col] == 'In Progress'])
-            not_started = len(df1[df1[status_col] == 'Not Started'])
+            completed = engine.status_count('Completed')
+            in_progress = engine.status_count('In Progress')
+            not_started = engine.status_count('Not Started')
             
             with col1:
                 st.metric("Total", total)
@@ -84,51 +70,20 @@ if sheet_url and os.path.exists('google-credentials.json'):
         # Simple status chart
         if status_col:
             st.subheader("📈 Status Distribution")
-            status_counts = df1[status_col].value_counts()
-            chart_data = pd.DataFrame({
-                'Status': status_counts.index,
-                'Count': status_counts.values
-            })
-            
-            chart = alt.Chart(chart_data).mark_bar().encode(
-                x='Status:N',
-                y='Count:Q',
-                color='Status:N'
-            ).properties(height=300)
-            
-            st.altair_chart(chart, use_container_width=True)
+            show_chart("status_colored", lambda: engine.status_counts().dropna(subset=['Status']), frame_version)
         
         # Strategic Pillars Summary
-        pillar_col = None
-        for col in df1.columns:
-            if 'pillar' in col.lower() or 'strategic' in col.lower():
-                pillar_col = col
-                break
-        
         if pillar_col and status_col:
             st.subheader("🏛️ Strategic Pillars Summary")
             
-            # Create summary
-            pillar_summary = df1.groupby(pillar_col)[status_col].value_counts().unstack(fill_value=0).reset_index()
-            
-            # Ensure all status columns exist
-            for status in ['Completed', 'In Progress', 'Not Started']:
-                if status not in pillar_summary.columns:
-                    pillar_summary[status] = 0
-            
-            # Calculate totals
-            pillar_summary['Total'] = pillar_summary[['Completed', 'In Progress', 'Not Started']].sum(axis=1)
-            pillar_summary['% Completed'] = (pillar_summary['Completed'] / pillar_summary['Total'] * 100).round(1)
-            
-            # Rename and reorder
-            pillar_summary = pillar_summary.rename(columns={pillar_col: "Strategic Pillar"})
-            pillar_summary = pillar_summary[["Strategic Pillar", "Total", "Completed", "In Progress", "Not Started", "% Completed"]]
+            pillar_summary = engine.pillar_summary()
             
             st.dataframe(pillar_summary, use_container_width=True)
         
         # Main data table
         st.subheader("📋 Detailed Data")
-        st.dataframe(df1, use_container_width=True)
+        # Paged server-side so only the visible rows are sent to the browser
+        paginated_table(df1, frame_version, key="detailed")
         
     else:
         st.error("❌ Could not load data from Google Sheets")
@@ -138,3 +93,5 @@ else:
     st.info("Please ensure google-credentials.json is in the app folder and the URL is correct.")
 
 st.caption("🚀 Fast deployment version - optimized for Streamlit Cloud")
+
+finish_rerun()
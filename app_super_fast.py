@@ -1,9 +1,8 @@
 import streamlit as st
-import pandas as pd
-import altair as alt
-import gspread
-from google.oauth2.service_account import Credentials
-import os
+from data_sources import TRACKER_WORKSHEET, GoogleSheetsSource, open_tracker
+from table_pager import paginated_table
+from charts import show_chart
+from perf import finish_rerun, start_rerun
 import time
 
 # Page config
@@ -14,38 +13,8 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
-# Cache data loading for 10 minutes
-@st.cache_data(ttl=600)
-def load_google_sheet_fast(sheet_url, worksheet_name):
-    """Load data from Google Sheets with minimal processing"""
-    try:
-        if not os.path.exists('google-credentials.json'):
-            st.error("Google credentials file not found. Please add google-credentials.json to the project folder.")
-            return None
-        
-        # Authenticate
-        scope = ['https://spreadsheets.google.com/feeds', 'https://www.googleapis.com/auth/drive']
-        creds = Credentials.from_service_account_file('google-credentials.json', scopes=scope)
-        client = gspread.authorize(creds)
-        
-        # Extract sheet ID from URL
-        sheet_id = sheet_url.split('/d/')[1].split('/')[0]
-        sheet = client.open_by_key(sheet_id)
-        
-        # Get worksheet
-        try:
-            worksheet = sheet.worksheet(worksheet_name)
-        except gspread.WorksheetNotFound:
-            st.error(f"Worksheet '{worksheet_name}' not found in the Google Sheet.")
-            return None
-        
-        # Get data
-        data = worksheet.get_all_records()
-        return pd.DataFrame(data)
-        
-    except Exception as e:
-        st.error(f"Error loading data: {str(e)}")
-        return None
+# Time each pipeline stage of this rerun (sidebar panel with ?perf=1, metrics file via env)
+start_rerun()
 
 # Main app
 st.title("📊 Progress Dashboard")
@@ -62,28 +31,34 @@ with st.sidebar:
 
 # Load data with loading spinner
 with st.spinner("🔄 Loading data from Google Sheets..."):
-    df1 = load_google_sheet_fast(sheet_url, "JNG V2.0_GTM Dashboard")
+    # Same cached, revision-aware pipeline as app.py
+    source = GoogleSheetsSource(sheet_url, [TRACKER_WORKSHEET])
+    tracker, _ = open_tracker(source)
+source.show_notices()
 
-if df1 is None:
+if tracker is None:
     st.error("❌ Failed to load data. Please check your Google Sheet URL and credentials.")
+    finish_rerun()
     st.stop()
 
 # Quick summary metrics
 st.subheader("📌 Quick Summary")
 col1, col2, col3, col4 = st.columns(4)
 
-# Find status column
-status_col = None
-for col in df1.columns:
-    if 'status' in col.lower():
-        status_col = col
-        break
+# Status and pillar columns, resolved once per data version
+df1 = tracker.df
+status_col = tracker.col_map.get("status")
+pillar_col = tracker.col_map.get("pillar")
+
+# One count cube answers the metrics, the pillar summary and the chart
+engine = tracker.engine
+frame_version = tracker.version_key
 
 if status_col:
     total = len(df1)
-    completed = len(df1[df1[status_col] == 'Completed'])
-    in_progress = len(df1[df1[status_col] == 'In Progress'])
-    not_started = len(df1[df1[status_col] == 'Not Started'])
+    completed = engine.status_count('Completed')
+    in_progress = engine.status_count('In Progress')
+    not_started = engine.status_count('Not Started')
     
     col1.metric("Total", total)
     col2.metric("Completed", completed)
@@ -98,28 +73,8 @@ else:
 # Strategic Pillars Summary
 st.subheader("🏛️ Strategic Pillars Summary")
 
-# Find pillar column
-pillar_col = None
-for col in df1.columns:
-    if 'pillar' in col.lower():
-        pillar_col = col
-        break
-
 if pillar_col and status_col:
-    # Create summary
-    pillar_summary = df1.groupby(pillar_col)[status_col].value_counts().unstack(fill_value=0).reset_index()
-    
-    # Ensure all status columns exist
-    for status in ['Completed', 'In Progress', 'Not Started']:
-        if status not in pillar_summary.columns:
-            pillar_summary[status] = 0
-    
-    # Calculate totals and percentages
-    pillar_summary['Total'] = pillar_summary[['Completed', 'In Progress', 'Not Started']].sum(axis=1)
-    pillar_summary['% Completed'] = (pillar_summary['Completed'] / pillar_summary['Total'] * 100).round(1)
-    
-    # Rename pillar column
-    pillar_summary = pillar_summary.rename(columns={pillar_col: "Strategic Pillar"})
+    pillar_summary = engine.pillar_summary()
     
     # Display
     st.dataframe(pillar_summary, use_container_width=True)
@@ -129,22 +84,13 @@ else:
 # Simple status chart
 if status_col:
     st.subheader("📈 Status Distribution")
-    status_counts = df1[status_col].value_counts()
-    chart_data = pd.DataFrame({
-        'Status': status_counts.index,
-        'Count': status_counts.values
-    })
-    
-    chart = alt.Chart(chart_data).mark_bar().encode(
-        x='Status:N',
-        y='Count:Q',
-        tooltip=['Status', 'Count']
-    ).properties(height=300)
-    
-    st.altair_chart(chart, use_container_width=True)
+    show_chart("status_tooltip", lambda: engine.status_counts().dropna(subset=['Status']), frame_version)
 
 # Basic data table
 st.subheader("📋 Data Table")
-st.dataframe(df1, use_container_width=True)
+# Paged server-side so only the visible rows are sent to the browser
+paginated_table(df1, frame_version, key="data_table")
 
 st.caption("🚀 Super Fast Version - Ready for Streamlit Cloud deployment!")
+
+finish_rerun()
@@ -0,0 +1,281 @@
+import argparse
+import csv
+import json
+import os
+import random
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.synthetic import synthetic_summary_grid, synthetic_tracker
+
+ENTRY_POINTS = ["app.py", "app_fast.py", "app_super_fast.py"]
+SHEET_ID = "186RIUMro2AO0JofZjJFRV6HSLpGQN1PDJeTsqBYXde4"
+TRACKER_CSV = "JNG_GTM_Dashboard-Tracker.csv"
+# Worksheets app.py's auto-refresh watcher polls
+WATCHED = ("JNG V2.0_GTM Dashboard", "Summary")
+
+# The apps poll every 30 s; poll fast enough that a refresh step sees its own edit
+POLL_INTERVAL = 0.5
+REFRESH_WAIT = 10
+
+
+def _widget(widgets, label=None, key=None):
+    for widget in widgets:
+        if (label is not None and widget.label == label) or (key is not None and widget.key == key):
+            return widget
+    return None
+
+
+def _narrow_status(at):
+    status = _widget(at.multiselect, label="Status")
+    if status is None:
+        return None
+    return status.set_value(status.options[:1] if len(status.value) > 1 else status.options)
+
+
+def _search(at, rng):
+    box = _widget(at.text_input, label="Search KPI / Metric (contains)")
+    if box is None:
+        return None
+    return box.set_value(rng.choice(["pilot", "buyer", "vendor", "", "target list"]))
+
+
+def _sort(at, rng):
+    for key in ("tracker_sort", "detailed_sort", "data_table_sort"):
+        sort = _widget(at.selectbox, key=key)
+        if sort is not None:
+            return sort.set_value(rng.choice(sort.options))
+    return None
+
+
+def _download(at):
+    prepare = _widget(at.button, key="export_tracker_prepare")
+    return prepare.click() if prepare is not None else None
+
+
+def _auto_refresh(at):
+    """Edit the fake sheet and wait for the shared poller to pick the edit up.
+
+    The watcher fragment's next tick then sees new data and reruns the app;
+    _session times that tick and the full rerun separately.
+    """
+    from refresh_scheduler import refresh_scheduler
+    from sheets_client import get_client
+
+    toggle = _widget(at.checkbox, label="🔄 Auto-refresh every 30 seconds")
+    if toggle is None:
+        return None
+    before = refresh_scheduler.latest((SHEET_ID, WATCHED))
+    get_client().session.touch(SHEET_ID)
+    if not toggle.value:
+        # The rerun that turns auto-refresh on starts the poller itself
+        toggle.check()
+        return at
+    deadline = time.monotonic() + REFRESH_WAIT
+    while refresh_scheduler.latest((SHEET_ID, WATCHED)) == before and time.monotonic() < deadline:
+        time.sleep(POLL_INTERVAL / 5)
+    return at
+
+
+# (step name, weight, action); actions return None when the entry point lacks the widget
+INTERACTIONS = [
+    ("filter", 4, lambda at, rng: _narrow_status(at)),
+    ("search", 3, _search),
+    ("sort", 2, _sort),
+    ("download", 1, lambda at, rng: _download(at)),
+    ("refresh", 2, lambda at, rng: _auto_refresh(at)),
+]
+
+
+def _write_fake_sheet(root, rows, seed):
+    """Fake-backend folder for the apps' default sheet: the real tracker, or a synthetic one"""
+    sheet_dir = os.path.join(root, SHEET_ID)
+    os.makedirs(sheet_dir)
+    tracker = os.path.join(sheet_dir, "JNG V2.0_GTM Dashboard.csv")
+    if rows is None:
+        shutil.copyfile(TRACKER_CSV, tracker)
+        df = pd.read_csv(TRACKER_CSV)
+    else:
+        df = synthetic_tracker(rows, seed=seed)
+        df.to_csv(tracker, index=False)
+    with open(os.path.join(sheet_dir, "Summary.csv"), "w", newline="") as f:
+        csv.writer(f).writerows(synthetic_summary_grid(df))
+
+
+def _share_runtime():
+    """Let AppTest sessions run concurrently in one process.
+
+    Every AppTest run installs a mock Runtime and removes it when it ends,
+    which pulls the runtime out from under any other session still running.
+    Pin one shared mock runtime (and AppTest mode) for the whole process instead.
+    """
+    from streamlit import config
+    from streamlit.runtime import Runtime
+    from streamlit.runtime.caching.storage.dummy_cache_storage import MemoryCacheStorageManager
+    from streamlit.runtime.media_file_manager import MediaFileManager
+    from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
+
+    shared = MagicMock(spec=Runtime)
+    shared.media_file_mgr = MediaFileManager(MemoryMediaFileStorage("/mock/media"))
+    shared.cache_storage_manager = MemoryCacheStorageManager()
+    Runtime.instance = classmethod(lambda cls: shared)
+    Runtime.exists = classmethod(lambda cls: True)
+    config.set_option("global.appTest", True)
+
+
+def _session(entry, steps, seed, think, timeout, samples, errors):
+    from streamlit.testing.v1 import AppTest
+
+    from refresh_scheduler import watch_sheet
+
+    rng = random.Random(seed)
+    at = AppTest.from_file(entry, default_timeout=timeout)
+    names, weights = [n for n, _, _ in INTERACTIONS], [w for _, w, _ in INTERACTIONS]
+    actions = {n: a for n, _, a in INTERACTIONS}
+    step = "open"
+    for i in range(steps + 1):
+        if i:
+            step = rng.choices(names, weights)[0]
+            if actions[step](at, rng) is None:
+                continue
+            time.sleep(rng.uniform(0, think))
+            if step == "refresh":
+                # AppTest can only rerun the whole script, so the watcher fragment's
+                # tick (the fragment-only rerun) is timed on its own
+                start = time.perf_counter()
+                watch_sheet(SHEET_ID, WATCHED)
+                samples.append(("refresh_fragment", time.perf_counter() - start))
+                step = "refresh_full"
+        start = time.perf_counter()
+        try:
+            at.run()
+        except Exception as e:
+            errors.append(f"{step}: {e}")
+            return
+        samples.append((step, time.perf_counter() - start))
+        if at.exception:
+            errors.append(f"{step}: {at.exception[0].value}")
+            return
+
+
+def _percentiles(values):
+    if not values:
+        return {}
+    p50, p95, p99 = np.percentile(values, [50, 95, 99])
+    return {"count": len(values), "p50_s": p50, "p95_s": p95, "p99_s": p99, "max_s": max(values)}
+
+
+def run_entry(entry, sessions, steps, seed=0, think=0.5, timeout=120):
+    """Drive `sessions` concurrent AppTest sessions through entry; returns one report row"""
+    from refresh_scheduler import refresh_scheduler
+    from sheets_client import get_client
+    from sheets_gateway import gateway
+
+    _share_runtime()
+    refresh_scheduler.interval = POLL_INTERVAL
+    samples, errors = [], []
+    threads = [
+        threading.Thread(target=_session, args=(entry, steps, seed + i, think, timeout, samples, errors))
+        for i in range(sessions)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    api = gateway.stats()
+    backend = get_client().session.stats()
+    by_step = {}
+    for step, seconds in samples:
+        by_step.setdefault(step, []).append(seconds)
+    return {
+        "entry": entry,
+        "sessions": sessions,
+        "steps_per_session": steps,
+        "elapsed_s": elapsed,
+        "rerun": _percentiles([s for step, s in samples if step != "refresh_fragment"]),
+        "fragment_rerun": _percentiles([s for step, s in samples if step == "refresh_fragment"]),
+        "by_step": {step: _percentiles(values) for step, values in sorted(by_step.items())},
+        # ru_maxrss is KiB on Linux
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "backend_requests": backend.get("requests", 0),
+        "backend_requests_per_session": backend.get("requests", 0) / sessions,
+        "gateway": api,
+        "errors": errors,
+    }
+
+
+def _worker(args):
+    print(json.dumps(run_entry(args.worker, args.sessions, args.steps, seed=args.seed,
+                               think=args.think, timeout=args.timeout)))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulate concurrent viewers of the dashboard apps.")
+    parser.add_argument("--entries", nargs="+", default=ENTRY_POINTS, help="Streamlit scripts to drive")
+    parser.add_argument("--sessions", type=int, default=50, help="concurrent sessions per entry point")
+    parser.add_argument("--steps", type=int, default=10, help="interactions per session after the first load")
+    parser.add_argument("--think", type=float, default=0.5, help="max seconds a viewer waits between interactions")
+    parser.add_argument("--rows", type=int, help="serve a synthetic tracker this big instead of the CSV")
+    parser.add_argument("--latency", type=float, default=0.2, help="seconds the fake Sheets API takes per request")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--timeout", type=float, default=120, help="seconds before a rerun counts as failed")
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    if args.worker:
+        return _worker(args)
+
+    results = []
+    with tempfile.TemporaryDirectory() as root:
+        _write_fake_sheet(os.path.join(root, "sheets"), args.rows, args.seed)
+        env = dict(
+            os.environ,
+            PYTHONPATH=os.pathsep.join(filter(None, [os.getcwd(), os.environ.get("PYTHONPATH")])),
+            DASHBOARD_FAKE_SHEETS_DIR=os.path.join(root, "sheets"),
+            DASHBOARD_FAKE_SHEETS_LATENCY=str(args.latency),
+            DASHBOARD_FAKE_SHEETS_SEED=str(args.seed),
+        )
+        for entry in args.entries:
+            env["DASHBOARD_SNAPSHOT_DIR"] = os.path.join(root, "snapshots", entry)
+            # One process per entry point so caches and peak RSS are its own
+            command = [sys.executable, "-m", "benchmarks.load_test", "--worker", entry,
+                       "--sessions", str(args.sessions), "--steps", str(args.steps), "--think", str(args.think),
+                       "--seed", str(args.seed), "--timeout", str(args.timeout)]
+            done = subprocess.run(command, env=env, capture_output=True, text=True)
+            if done.returncode:
+                print(done.stderr, file=sys.stderr)
+                results.append({"entry": entry, "errors": [f"worker exited with {done.returncode}"]})
+                continue
+            result = json.loads(done.stdout.strip().splitlines()[-1])
+            rerun, fragment = result["rerun"], result["fragment_rerun"]
+            print(f"{entry:<18} p50 {rerun.get('p50_s', 0) * 1000:8.1f} ms  p95 {rerun.get('p95_s', 0) * 1000:8.1f} ms  "
+                  f"p99 {rerun.get('p99_s', 0) * 1000:8.1f} ms  fragment p95 {fragment.get('p95_s', 0) * 1000:6.1f} ms  "
+                  f"peak RSS {result['peak_rss_mb']:7.1f} MB  "
+                  f"{result['backend_requests_per_session']:.2f} API requests/session", file=sys.stderr)
+            results.append(result)
+
+    report = {"meta": {"timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"), "sessions": args.sessions,
+                       "steps": args.steps, "rows": args.rows, "latency_s": args.latency, "seed": args.seed},
+              "results": results}
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+import argparse
+import itertools
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from aggregates import AggregateEngine
+from benchmarks.synthetic import OWNERS, PILLARS, synthetic_grid, synthetic_summary_grid, synthetic_tracker
+from charts import chart_spec
+from exports import write_export
+from filter_index import FilterIndex
+from owner_index import OwnerIndex
+from schema import TrackerSchema, resolve_columns
+from search_index import SearchIndex
+from sheets_loader import normalize_grid, summary_frame
+from table_pager import TablePager
+
+DEFAULT_SIZES = [25, 1_000, 10_000, 100_000, 1_000_000]
+SEARCH_QUERIES = ["pilot", "buyer meet*", "vendor onboarding", "#12"]
+
+_chart_versions = itertools.count()
+
+
+def _git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _loop_normalize(values):
+    """The per-row trim/pad loop normalize_grid replaced, kept as a reference point"""
+    cleaned, width = [], 0
+    for row in values:
+        while row and row[-1] == "":
+            row = row[:-1]
+        cleaned.append(row)
+        width = max(width, len(row))
+    cleaned = [row + [""] * (width - len(row)) for row in cleaned]
+    df = pd.DataFrame(cleaned[1:], columns=cleaned[0])
+    return df.dropna(axis=1, how="all").dropna(axis=0, how="all")
+
+
+def _selections(owners):
+    """A spread of multiselect choices: none, one pillar, statuses, an owner, all three"""
+    return [
+        dict(),
+        dict(pillars=[PILLARS[0]]),
+        dict(statuses=["In Progress", "Completed"]),
+        dict(owners=[owners[0]]),
+        dict(pillars=PILLARS[:3], statuses=["Not Started"], owners=owners[:2]),
+    ]
+
+
+def _stages(df):
+    """(name, callable) per pipeline stage; each callable does one full, uncached run"""
+    grid = synthetic_grid(df)
+    summary_grid = synthetic_summary_grid(df)
+    tracker = TrackerSchema(df)
+    typed, col_map = tracker.df, tracker.col_map
+    owners = OwnerIndex(typed, col_map)
+    filters = FilterIndex(typed, col_map, owner_index=owners)
+    search = SearchIndex(typed, col_map)
+    selections = _selections(OWNERS)
+    rows = filters.select(**selections[-1])
+
+    def column_mapping():
+        resolve_columns.cache_clear()
+        resolve_columns(tuple(df.columns))
+
+    def filtering():
+        filters._memo.clear()
+        for selection in selections:
+            filters.select(**selection)
+
+    def searching():
+        search._cache.clear()
+        for query in SEARCH_QUERIES:
+            search.search(query)
+
+    def aggregation():
+        engine = AggregateEngine.from_frame(typed, col_map)
+        for selection in selections:
+            selection = dict(selection, owners=owners.expand(selection.get("owners")))
+            engine.status_counts(**selection)
+            engine.pillar_status(**selection)
+            owners.workload(engine.owner_status(**selection), selection.get("owners"))
+        engine.pillar_summary()
+
+    engine = AggregateEngine.from_frame(typed, col_map)
+
+    def chart_data():
+        version = ("benchmark", next(_chart_versions))
+        chart_spec("status", lambda: engine.status_counts(), version)
+        chart_spec("pillar_status", lambda: engine.pillar_status(), version)
+        chart_spec("owner_status", lambda: owners.workload(engine.owner_status()), version)
+
+    def table_page():
+        TablePager(typed).page("benchmark", rows, sort=(col_map["owner"], True), page=2, page_size=50)
+
+    return [
+        ("summary_normalization", lambda: (normalize_grid(grid), summary_frame(summary_grid))),
+        ("summary_normalization_loop", lambda: (_loop_normalize(grid), _loop_normalize(summary_grid))),
+        ("column_mapping", column_mapping),
+        ("schema_typing", lambda: TrackerSchema(df)),
+        ("owner_index_build", lambda: OwnerIndex(typed, col_map)),
+        ("filter_index_build", lambda: FilterIndex(typed, col_map, owner_index=owners)),
+        ("filtering", filtering),
+        ("search_index_build", lambda: SearchIndex(typed, col_map)),
+        ("search", searching),
+        ("aggregation", aggregation),
+        ("chart_data", chart_data),
+        ("table_page", table_page),
+        ("csv_export", lambda: write_export(typed.iloc[rows], "csv")),
+        ("csv_export_full", lambda: write_export(typed, "csv")),
+    ]
+
+
+def _time(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def run(sizes, repeat=5, seed=0, stages=None, log=sys.stderr):
+    results = []
+    for n_rows in sizes:
+        df = synthetic_tracker(n_rows, seed=seed)
+        # Big trackers get fewer repetitions so a full run stays practical
+        n_repeat = max(1, repeat if n_rows <= 100_000 else repeat // 3)
+        for name, fn in _stages(df):
+            if stages and name not in stages:
+                continue
+            times = _time(fn, n_repeat)
+            results.append({
+                "rows": n_rows,
+                "stage": name,
+                "repeat": n_repeat,
+                "best_s": min(times),
+                "median_s": statistics.median(times),
+            })
+            print(f"{n_rows:>9,} rows  {name:<26} best {min(times) * 1000:10.2f} ms", file=log)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time the dashboard pipeline on synthetic trackers.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="tracker row counts")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per stage (best and median are reported)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--stages", nargs="+", help="only run these stages")
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    args = parser.parse_args(argv)
+
+    report = {
+        "meta": {
+            "revision": _git_revision(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "seed": args.seed,
+        },
+        "results": run(args.sizes, repeat=args.repeat, seed=args.seed, stages=args.stages),
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+import numpy as np
+import pandas as pd
+
+COLUMNS = ["Strategic Pillar", "KPI / Metric", "Max out Target TAT", "Frequency",
+           "Who is Responsible", "Status", "Action Items"]
+
+PILLARS = [
+    "Account-Based GTM (ABM) & Client Acquisition", "Category Studios & Product Hooks",
+    "Channel & Distribution Build-Out", "Commercial & Financial Controls",
+    "Company Entity/Overseas office", "Compliance & Tech Stack", "Events & Visibility",
+]
+OWNERS = ["COO", "MD", "CFO", "Head Sourcing", "SCM", "Tech", "QA Director", "Category Pod Leads"]
+OWNER_SEPARATORS = [",", ", ", "/", " / "]
+STATUSES = ["Not Started", "In Progress", "Completed"]
+STATUS_WEIGHTS = [0.7, 0.2, 0.1]
+FREQUENCIES = ["Day 30", "Day 60", "Day 90", "Monthly", "Quarterly", "Q3 FY26", "Event-based", "Annual/ 2 Seasons"]
+TARGETS = [
+    "100 accounts", "≥ 30 meetings in 90 -120 days", "≥ 50% by Q4 FY26", "≥ 3 by Q4 FY26", "Q3-Q4 FY26",
+    "≥ 40% of active projects", "30–50 SKUs/category", "70% T&A cut", "2–3", "Q2 FY26", "2 signed",
+    "Live by Q4 FY25", "≥ 95%", "≥ 15×", "Maintain 18–20%", "≤ 3× EBITDA", "1 per quarter", "2/year",
+]
+WORDS = [
+    "buyer", "meetings", "secured", "pilot", "orders", "vendor", "onboarding", "margin", "category",
+    "launch", "compliance", "audit", "showroom", "samples", "pricing", "catalog", "freight", "quality",
+    "forecast", "retailer", "contract", "sourcing", "target", "list", "finalized", "dashboard",
+]
+ACTIONS = ["Data Extract from Panjiva", "Share deck with buyers", "Follow up on samples",
+           "Close vendor audit", "Book booth"]
+
+
+def _owner_combos(rng, count=60):
+    """Distinct multi-owner strings such as "MD,COO, Head Sourcing" or "COO/CFO" """
+    combos = set()
+    while len(combos) < count:
+        names = rng.choice(OWNERS, size=rng.integers(1, 4), replace=False)
+        combos.add(rng.choice(OWNER_SEPARATORS).join(names))
+    return sorted(combos)
+
+
+def synthetic_tracker(n_rows, seed=0):
+    """Tracker frame shaped like JNG_GTM_Dashboard-Tracker.csv with n_rows rows"""
+    rng = np.random.default_rng(seed)
+    owners = _owner_combos(rng)
+    words = np.array(WORDS, dtype=object)
+    metric_words = words[rng.integers(0, len(words), size=(n_rows, 4))]
+    metrics = [" ".join(w).capitalize() + f" #{i}" for i, w in enumerate(metric_words)]
+    actions = np.array(ACTIONS + [None] * (len(ACTIONS) * 4), dtype=object)
+    return pd.DataFrame({
+        "Strategic Pillar": rng.choice(PILLARS, size=n_rows),
+        "KPI / Metric": metrics,
+        "Max out Target TAT": rng.choice(TARGETS, size=n_rows),
+        "Frequency": rng.choice(FREQUENCIES, size=n_rows),
+        "Who is Responsible": rng.choice(owners, size=n_rows),
+        "Status": rng.choice(STATUSES, size=n_rows, p=STATUS_WEIGHTS),
+        "Action Items": actions[rng.integers(0, len(actions), size=n_rows)],
+    }, columns=COLUMNS)
+
+
+def synthetic_grid(df):
+    """The raw get_all_values()-style grid the Sheets API would return for df"""
+    body = df.fillna("").astype(str).values.tolist()
+    # Sheets drops trailing empty cells, so rows come back ragged
+    for row in body:
+        while row and row[-1] == "":
+            row.pop()
+    return [list(df.columns)] + body
+
+
+def synthetic_summary_grid(df):
+    """Raw grid of a "Summary" worksheet for df, with an extra notes column"""
+    counts = df["Status"].value_counts()
+    total = len(df)
+    completed = int(counts.get("Completed", 0))
+    return [
+        ["Summary Metric", "Value", "Notes"],
+        ["Total Deliverables", str(total)],
+        ["Not Started (count)", str(int(counts.get("Not Started", 0)))],
+        ["In Progress (count)", str(int(counts.get("In Progress", 0)))],
+        ["Completed (count)", str(completed), "auto"],
+        ["% Completed", f"{100 * completed / total:.1f}" if total else "0"],
+    ]
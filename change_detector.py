@@ -0,0 +1,90 @@
+import copy
+import datetime
+import hashlib
+import json
+import threading
+import time
+
+from gspread.urls import SPREADSHEET_VALUES_BATCH_URL
+from gspread.utils import absolute_range_name
+
+from perf import stage
+
+# Revision checks closer together than this reuse the last answer
+MIN_CHECK_INTERVAL = 15
+
+
+class SheetState:
+    def __init__(self):
+        self.revision = None
+        self.last_checked = None
+        self.last_changed = None
+        self.error = None
+
+
+class ChangeDetector:
+    """Cheap revision checks so full downloads only happen when a sheet changes"""
+
+    def __init__(self, min_interval=MIN_CHECK_INTERVAL):
+        self.min_interval = min_interval
+        self._states = {}
+        self._lock = threading.Lock()
+
+    def state(self, sheet_id):
+        """Copy of a spreadsheet's state, consistent even while checks update it"""
+        with self._lock:
+            return copy.copy(self._states.setdefault(sheet_id, SheetState()))
+
+    def check(self, client, sheet_id, sample_worksheets=(), force=False):
+        """Return the current revision marker of a spreadsheet.
+
+        Uses the Drive modifiedTime (one tiny metadata call). If Drive is not
+        reachable with these credentials, falls back to a hash of the full
+        contents of each worksheet in sample_worksheets, which costs as much
+        as loading them.
+        """
+        now = time.time()
+        with self._lock:
+            state = self._states.setdefault(sheet_id, SheetState())
+            if (not force and state.last_checked is not None
+                    and now - state.last_checked < self.min_interval):
+                return state.revision
+
+        # The network call runs unlocked; only the state update is serialized
+        with stage("revision_check"):
+            try:
+                revision, changed_at = self._drive_revision(client, sheet_id)
+            except Exception:
+                try:
+                    revision, changed_at = self._content_revision(client, sheet_id, sample_worksheets), None
+                except Exception as e:
+                    # Keep serving the last known revision until the next check succeeds
+                    with self._lock:
+                        state.error = str(e)
+                        state.last_checked = now
+                        return state.revision
+
+        with self._lock:
+            state.error = None
+            state.last_checked = now
+            if revision != state.revision:
+                state.revision = revision
+                state.last_changed = changed_at or now
+        return revision
+
+    def _drive_revision(self, client, sheet_id):
+        modified = client.get_file_drive_metadata(sheet_id)["modifiedTime"]
+        changed_at = datetime.datetime.fromisoformat(modified.replace("Z", "+00:00")).timestamp()
+        return modified, changed_at
+
+    def _content_revision(self, client, sheet_id, sample_worksheets):
+        # Whole used range: a sampled corner would miss edits outside it
+        params = {"ranges": [absolute_range_name(name) for name in sample_worksheets]}
+        body = client.request("get", SPREADSHEET_VALUES_BATCH_URL % sheet_id, params=params).json()
+        sample = [value_range.get("values", []) for value_range in body.get("valueRanges", [])]
+        digest = hashlib.sha1(json.dumps(sample).encode("utf-8")).hexdigest()
+        return "sha1:" + digest
+
+
+# Process-wide detector shared by every Streamlit session
+change_detector = ChangeDetector()
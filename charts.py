@@ -0,0 +1,111 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from contextlib import nullcontext
+
+import altair as alt
+import pyarrow as pa
+import streamlit as st
+
+from perf import cache_lookup, stage
+
+MAX_SPECS = 256
+
+_DATA_NAME = "values"
+
+# Dashboard charts by name; each is compiled to a Vega-Lite template once
+CHART_BUILDERS = {
+    "status": lambda data: alt.Chart(data).mark_bar().encode(
+        x=alt.X("Status:N", sort='-y'),
+        y="Count:Q",
+        tooltip=["Status:N", "Count:Q"]
+    ).properties(height=300),
+    "pillar_status": lambda data: alt.Chart(data).mark_bar().encode(
+        x=alt.X("Pillar:N", sort=alt.SortField(field="Pillar")),
+        y=alt.Y("Count:Q", stack="zero"),
+        color="Status:N",
+        tooltip=["Pillar:N", "Status:N", "Count:Q"]
+    ).properties(height=380),
+    "owner_status": lambda data: alt.Chart(data).mark_bar().encode(
+        x=alt.X("Owner:N", sort=alt.SortField(field="Owner")),
+        y=alt.Y("Count:Q", stack="zero"),
+        color="Status:N",
+        tooltip=["Owner:N", "Status:N", "Count:Q"]
+    ).properties(height=320),
+    "status_colored": lambda data: alt.Chart(data).mark_bar().encode(
+        x='Status:N',
+        y='Count:Q',
+        color='Status:N'
+    ).properties(height=300),
+    "status_tooltip": lambda data: alt.Chart(data).mark_bar().encode(
+        x='Status:N',
+        y='Count:Q',
+        tooltip=['Status:N', 'Count:Q']
+    ).properties(height=300),
+}
+
+_templates = {}
+_specs = OrderedDict()
+_lock = threading.Lock()
+
+
+def _template(name):
+    """Vega-Lite spec of a chart without its data, compiled once per process"""
+    with _lock:
+        if name in _templates:
+            return _templates[name]
+    chart = CHART_BUILDERS[name](alt.NamedData(name=_DATA_NAME))
+    # Same as st.altair_chart: Streamlit applies its own theme on top of an unthemed spec
+    with alt.themes.enable("none") if alt.themes.active == "default" else nullcontext():
+        template = chart.to_dict()
+    with _lock:
+        _templates[name] = template
+    return template
+
+
+def _arrow_bytes(df):
+    table = pa.Table.from_pandas(df)
+    sink = pa.BufferOutputStream()
+    with pa.RecordBatchStreamWriter(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def chart_spec(name, data, version, filter_key=None):
+    """Full spec for a chart, memoized per (chart, data version, filter key).
+
+    data is a callable returning the aggregated frame; it is only called
+    when the spec isn't cached. The data is pre-serialized to Arrow under a
+    content-hash dataset name, which st.vega_lite_chart passes through as is.
+    """
+    key = (name, version, filter_key)
+    with _lock:
+        spec = _specs.get(key)
+        if spec is not None:
+            _specs.move_to_end(key)
+    cache_lookup("chart", spec is not None)
+    if spec is not None:
+        return spec
+    frame = data()
+    with stage("chart_spec"):
+        payload = _arrow_bytes(frame)
+        dataset = hashlib.md5(payload).hexdigest()
+        spec = {**_template(name), "data": {"name": dataset}, "datasets": {dataset: payload}}
+    with _lock:
+        _specs[key] = spec
+        while len(_specs) > MAX_SPECS:
+            _specs.popitem(last=False)
+    return spec
+
+
+def forget_version(version):
+    with _lock:
+        for key in [k for k in _specs if k[1] == version]:
+            del _specs[key]
+
+
+def show_chart(name, data, version, filter_key=None):
+    """Render a dashboard chart from its memoized spec"""
+    spec = chart_spec(name, data, version, filter_key)
+    with stage("chart_render"):
+        st.vega_lite_chart(spec=spec, use_container_width=True)
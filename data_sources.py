@@ -0,0 +1,260 @@
+import os
+import time
+from abc import ABC, abstractmethod
+
+import pandas as pd
+import streamlit as st
+
+from change_detector import change_detector
+from dataset_registry import current_session_id, registry
+from incremental import incremental_tracker
+from perf import stage
+from schema import schema_for
+from sheet_cache import sheet_cache
+from sheets_client import get_client, sheet_id_from_url
+from sheets_loader import fetch_worksheets, load_worksheets
+from snapshot_store import load_frames, read_csv_snapshotted, save_frames
+
+TRACKER_WORKSHEET = "JNG V2.0_GTM Dashboard"
+SUMMARY_WORKSHEET = "Summary"
+
+
+def format_clock(ts):
+    return time.strftime("%H:%M:%S", time.localtime(ts)) if ts else "—"
+
+
+def normalize_columns(df):
+    """Strip header whitespace without copying the data (frames may be shared by sessions)"""
+    if df is None:
+        return None
+    columns = [str(c).strip() for c in df.columns]
+    return df if columns == list(df.columns) else df.set_axis(columns, axis=1, copy=False)
+
+
+@st.cache_data
+def load_csv(file):
+    if file is None:
+        return None
+    return pd.read_csv(file)
+
+
+@st.cache_data
+def load_csv_path(path):
+    try:
+        return read_csv_snapshotted(path)
+    except Exception:
+        return None
+
+
+class DataSource(ABC):
+    """A tracker backend: named frames plus a cheap version marker.
+
+    load() returns {name: DataFrame or None} (or None when nothing could be
+    loaded); problems worth showing the user are collected in notices as
+    (level, message) pairs, level being a Streamlit call such as "error".
+    """
+
+    key = None
+
+    def __init__(self):
+        self.notices = []
+
+    @abstractmethod
+    def version(self):
+        """Cheap marker that changes whenever the data does; None when unknown"""
+
+    @abstractmethod
+    def load(self):
+        """{name: DataFrame or None}, or None when nothing could be loaded"""
+
+    def loaded_version(self):
+        """Version marker of the frames load() last returned; key caches on this, not version()"""
+        return self.version()
+
+    def show_notices(self):
+        for level, message in self.notices:
+            getattr(st, level)(message)
+
+
+class GoogleSheetsSource(DataSource):
+    """Worksheets of one spreadsheet, cached per revision with an on-disk snapshot fallback"""
+
+    def __init__(self, sheet_url, worksheet_names):
+        super().__init__()
+        self.sheet_url = sheet_url
+        self.worksheet_names = list(worksheet_names)
+        try:
+            self.sheet_id = sheet_id_from_url(sheet_url)
+        except IndexError:
+            self.sheet_id = None
+        self.key = self.sheet_id
+        self._revision = False  # not checked yet
+        self._loaded = None     # version of the frames load() returned
+
+    def version(self):
+        if self._revision is False:
+            client = get_client() if self.sheet_id else None
+            self._revision = (change_detector.check(client, self.sheet_id, self.worksheet_names)
+                              if client is not None else None)
+        return self._revision
+
+    def state(self):
+        """Change-detector state (last changed / last checked), or None"""
+        return change_detector.state(self.sheet_id) if self.version() is not None else None
+
+    def loaded_version(self):
+        return self._loaded
+
+    def load(self):
+        if self.sheet_id is None:
+            self.notices.append(("error", "Invalid Google Sheet URL."))
+            return None
+        revision = self.version()
+        key = (self.sheet_id, tuple(self.worksheet_names), revision)
+        refresh = lambda: fetch_worksheets(self.sheet_id, self.worksheet_names, revision)
+
+        if key not in sheet_cache:
+            # Warm start from the on-disk snapshot so the first paint doesn't wait on Sheets
+            snapshot = SnapshotSource(self.sheet_id, self.worksheet_names)
+            frames = snapshot.load()
+            if frames is not None:
+                if revision is not None and snapshot.meta["revision"] == revision:
+                    sheet_cache.put(key, frames)
+                else:
+                    # Snapshot is behind the live sheet: show it now under its own version
+                    # (never the live key), reconcile in the background
+                    sheet_cache.refresh_async(key, refresh)
+                    self._loaded = snapshot.version()
+                    return frames
+
+        error = []
+        frames = sheet_cache.get(key, lambda: self._fetch(revision, error), refresh)
+        if frames is not None:
+            self._loaded = revision
+            return frames
+        if not error:
+            return None
+        # Offline fallback: serve the last snapshot, uncached and under its own version
+        snapshot = SnapshotSource(self.sheet_id, self.worksheet_names)
+        frames = snapshot.load()
+        if frames is not None:
+            self.notices.append(("warning", f"⚠️ Google Sheets unavailable ({error[0]}); "
+                                            f"showing snapshot saved at {format_clock(snapshot.saved_at)}."))
+            self._loaded = snapshot.version()
+            return frames
+        self.notices.append(("error", f"Error loading {', '.join(self.worksheet_names)}: "
+                                      f"{error[0]} ({type(error[0]).__name__})"))
+        return None
+
+    def _fetch(self, revision, error):
+        """Load every worksheet in one batched request; a failure is appended to error"""
+        try:
+            # Reuse the process-wide authorized client (secrets first, then local file)
+            client = get_client()
+            if client is None:
+                self.notices.append(("error", "Google credentials not found in Streamlit secrets or local file."))
+                return None
+            # One metadata lookup (cached per sheet) plus one values:batchGet call
+            frames = load_worksheets(client, self.sheet_id, self.worksheet_names, revision)
+            for name, df in frames.items():
+                if df is None:
+                    self.notices.append(("error", f"Worksheet '{name}' not found in the Google Sheet."))
+            save_frames(self.sheet_id, frames, revision)
+            return frames
+        except Exception as e:
+            error.append(e)
+            return None
+
+
+class CsvSource(DataSource):
+    """Uploaded or local CSV files, one per logical frame name"""
+
+    key = "csv"
+
+    def __init__(self, files, tracker_name):
+        super().__init__()
+        self.files = files  # name -> uploaded file, path, or None
+        self.tracker_name = tracker_name
+
+    def version(self):
+        """Upload id or file modification time of the tracker file"""
+        file = self.files.get(self.tracker_name)
+        if file is None:
+            return None
+        if not isinstance(file, str):
+            return ("upload", file.file_id)
+        if os.path.exists(file):
+            return ("local", file, os.path.getmtime(file))
+        return None
+
+    def load(self):
+        with stage("csv_load"):
+            return {
+                name: None if file is None else load_csv_path(file) if isinstance(file, str) else load_csv(file)
+                for name, file in self.files.items()
+            }
+
+
+class SnapshotSource(DataSource):
+    """The last Arrow snapshot of a source's frames, for offline use"""
+
+    def __init__(self, source_key, names):
+        super().__init__()
+        self.key = source_key
+        self.names = list(names)
+        self.meta = None
+
+    @property
+    def saved_at(self):
+        return self.meta["saved_at"] if self.meta else None
+
+    def version(self):
+        if self.meta is None:
+            self.load()
+        if not self.meta:
+            return None
+        return ("snapshot", self.meta["revision"] or self.meta["saved_at"])
+
+    def load(self):
+        frames, self.meta = load_frames(self.key, self.names)
+        return frames
+
+
+def resolve_version(version, df):
+    """The source's version marker, or a content hash when it has none"""
+    if version is None:
+        return ("hash", int(pd.util.hash_pandas_object(df, index=False).sum()))
+    return version
+
+
+class Tracker:
+    """The shared per-version pipeline: typed frame, column map and count cube"""
+
+    def __init__(self, source_key, version, df):
+        self.source_key = source_key
+        self.version = version
+        self.version_key = (source_key, version)
+        # Typed (categorical) frame and standardized column names, resolved once per
+        # data version and shared by every session instead of per-session object copies
+        self.schema = schema_for(self.version_key, df)
+        self.df, self.col_map = self.schema.df, self.schema.col_map
+        # The pillar x owner x status cube is kept per source and updated from the
+        # row-level diff against the previous snapshot instead of being rebuilt
+        self.engine = incremental_tracker.ingest(source_key, version, self.df, self.col_map)
+
+
+def shared_tracker(source_key, version, df):
+    """Tracker for a data version from the process-wide registry, held by the current session"""
+    df = normalize_columns(df)
+    version = resolve_version(version, df)
+    return registry.acquire(current_session_id(), (source_key, version), lambda: Tracker(source_key, version, df))
+
+
+def open_tracker(source, tracker_name=TRACKER_WORKSHEET):
+    """Load a source and run its tracker frame through the pipeline; returns (Tracker or None, frames)"""
+    frames = source.load() or {}
+    frames = {name: normalize_columns(df) for name, df in frames.items()}
+    df = frames.get(tracker_name)
+    if df is None:
+        return None, frames
+    return shared_tracker(source.key, source.loaded_version(), df), frames
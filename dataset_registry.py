@@ -0,0 +1,127 @@
+import os
+import threading
+import time
+
+from streamlit import runtime
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+import aggregates
+import charts
+import filter_index
+import owner_index
+import schema
+import search_index
+import table_pager
+from exports import export_cache
+from perf import cache_lookup, stage
+
+# Sessions not seen for this long stop holding their dataset
+SESSION_TTL = float(os.environ.get("DASHBOARD_SESSION_TTL", 1800))
+
+# Per-version caches cleared when a version is evicted
+_VERSION_CACHES = [
+    schema.forget_version,
+    filter_index.forget_version,
+    owner_index.forget_version,
+    search_index.forget_version,
+    table_pager.forget_version,
+    charts.forget_version,
+    aggregates.forget_version,
+    export_cache.forget_version,
+]
+
+
+def current_session_id():
+    """Streamlit session id of the running script, or None outside a script run"""
+    ctx = get_script_run_ctx()
+    return ctx.session_id if ctx is not None else None
+
+
+class DatasetRegistry:
+    """Process-wide, read-only datasets keyed by data version and refcounted by session.
+
+    Every session viewing the same version gets the same object, so the
+    typed frame, count cube and indexes exist once per process; a session
+    itself only keeps widget state and row-position arrays. A version is
+    evicted, together with everything cached for it, once no live session
+    references it and it is no longer the newest version of its source.
+    Datasets are shared: callers must never mutate them.
+    """
+
+    def __init__(self, session_ttl=SESSION_TTL):
+        self.session_ttl = session_ttl
+        self._datasets = {}  # version key -> dataset
+        self._refs = {}      # version key -> session ids
+        self._sessions = {}  # session id -> (version key, last seen)
+        self._latest = {}    # source key -> newest version key
+        self._lock = threading.Lock()
+
+    def acquire(self, session_id, version_key, build):
+        """Dataset for version_key (built on first use), now held by session_id"""
+        with self._lock:
+            dataset = self._datasets.get(version_key)
+        cache_lookup("dataset", dataset is not None)
+        if dataset is None:
+            with stage("dataset_build"):
+                built = build()
+            with self._lock:
+                dataset = self._datasets.setdefault(version_key, built)
+
+        with self._lock:
+            self._latest[version_key[0]] = version_key
+            if session_id is not None:
+                previous = self._sessions.get(session_id)
+                self._sessions[session_id] = (version_key, time.monotonic())
+                self._refs.setdefault(version_key, set()).add(session_id)
+                if previous is not None and previous[0] != version_key:
+                    self._refs.get(previous[0], set()).discard(session_id)
+            evicted = self._collect_locked()
+        self._forget(evicted)
+        return dataset
+
+    def release(self, session_id):
+        """Stop session_id holding its dataset"""
+        with self._lock:
+            entry = self._sessions.pop(session_id, None)
+            if entry is not None:
+                self._refs.get(entry[0], set()).discard(session_id)
+            evicted = self._collect_locked()
+        self._forget(evicted)
+
+    def _session_alive(self, session_id, last_seen, now):
+        if now - last_seen > self.session_ttl:
+            return False
+        if runtime.exists():
+            return runtime.get_instance().is_active_session(session_id)
+        return True
+
+    def _collect_locked(self):
+        now = time.monotonic()
+        for session_id, (version_key, last_seen) in list(self._sessions.items()):
+            if not self._session_alive(session_id, last_seen, now):
+                del self._sessions[session_id]
+                self._refs.get(version_key, set()).discard(session_id)
+
+        latest = set(self._latest.values())
+        evicted = [key for key in self._datasets if not self._refs.get(key) and key not in latest]
+        for key in evicted:
+            del self._datasets[key]
+            self._refs.pop(key, None)
+        return evicted
+
+    def _forget(self, version_keys):
+        for version_key in version_keys:
+            for forget in _VERSION_CACHES:
+                forget(version_key)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "datasets": len(self._datasets),
+                "sessions": len(self._sessions),
+                "refs": {key: len(ids) for key, ids in self._refs.items()},
+            }
+
+
+# Process-wide registry shared by every Streamlit session
+registry = DatasetRegistry()
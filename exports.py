@@ -0,0 +1,128 @@
+import importlib.util
+import io
+import threading
+from collections import OrderedDict
+
+import streamlit as st
+
+from perf import cache_lookup, stage
+
+CSV_CHUNK_ROWS = 50_000
+MAX_CACHED_BYTES = 64 * 1024 * 1024
+
+# format -> (label, mime type, file extension, module it needs)
+FORMATS = {
+    "csv": ("CSV", "text/csv", ".csv", None),
+    "parquet": ("Parquet", "application/vnd.apache.parquet", ".parquet", "pyarrow"),
+    "xlsx": ("Excel", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", ".xlsx", "openpyxl"),
+}
+
+
+def available_formats():
+    """Export formats whose writer library is installed"""
+    return [fmt for fmt, (_, _, _, module) in FORMATS.items()
+            if module is None or importlib.util.find_spec(module) is not None]
+
+
+def iter_csv_chunks(df, chunk_rows=CSV_CHUNK_ROWS):
+    """Encode df as UTF-8 CSV a block of rows at a time"""
+    if df.empty:
+        yield df.to_csv(index=False).encode("utf-8")
+        return
+    for start in range(0, len(df), chunk_rows):
+        yield df.iloc[start:start + chunk_rows].to_csv(index=False, header=start == 0).encode("utf-8")
+
+
+def write_export(df, fmt):
+    """Serialize df in the given format"""
+    buffer = io.BytesIO()
+    if fmt == "csv":
+        for chunk in iter_csv_chunks(df):
+            buffer.write(chunk)
+    elif fmt == "parquet":
+        df.to_parquet(buffer, index=False)
+    elif fmt == "xlsx":
+        df.to_excel(buffer, index=False, engine="openpyxl")
+    else:
+        raise ValueError(f"Unknown export format: {fmt}")
+    return buffer.getvalue()
+
+
+class ExportCache:
+    """Export bytes per (data version, filter key, name, format), bounded by total size"""
+
+    def __init__(self, max_bytes=MAX_CACHED_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def peek(self, key):
+        """Cached bytes for key, or None, without counting a lookup"""
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+        return data
+
+    def get(self, key):
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+        cache_lookup("export", data is not None)
+        return data
+
+    def build(self, key, frame, fmt):
+        """Export bytes for key, serializing frame() only on a cache miss"""
+        data = self.get(key)
+        if data is not None:
+            return data
+        with stage("export"):
+            data = write_export(frame(), fmt)
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = data
+                self._size += len(data)
+            while self._size > self.max_bytes and len(self._entries) > 1:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+        return data
+
+    def forget_version(self, version):
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == version]:
+                self._size -= len(self._entries.pop(key))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+# Process-wide, shared by every session
+export_cache = ExportCache()
+
+
+def export_button(label, frame, version, filter_key=None, file_name="export", key="export"):
+    """Format picker plus a download button whose file is built only on request.
+
+    frame is a callable returning the DataFrame to export; it is not called
+    until someone asks for the file (or when it is already cached).
+    """
+    formats = available_formats()
+    c1, c2 = st.columns([1, 3])
+    with c1:
+        fmt = st.selectbox("Format", options=formats, format_func=lambda f: FORMATS[f][0],
+                           key=f"{key}_format", label_visibility="collapsed")
+    _, mime, extension, _ = FORMATS[fmt]
+    cache_key = (version, filter_key, key, fmt)
+    with c2:
+        # Only preparing a file counts as an export cache lookup, not every render
+        data = export_cache.peek(cache_key)
+        if data is None and st.button(f"Prepare {label}", key=f"{key}_prepare"):
+            with st.spinner("Preparing export..."):
+                data = export_cache.build(cache_key, frame, fmt)
+        if data is not None:
+            st.download_button(f"⬇️ Download {label}", data=data, file_name=file_name + extension,
+                               mime=mime, key=f"{key}_download")
@@ -0,0 +1,233 @@
+import csv
+import datetime
+import json
+import os
+import random
+import re
+import threading
+import time
+from collections import Counter, deque
+from urllib.parse import unquote
+
+import requests
+from gspread.urls import DRIVE_FILES_API_V3_URL, SPREADSHEETS_API_V4_BASE_URL
+from gspread.utils import a1_to_rowcol
+
+from sheets_gateway import GatewayClient
+
+# <dir>/<spreadsheet id>/<worksheet title>.csv; editing a file changes the revision
+FAKE_SHEETS_DIR = os.environ.get("DASHBOARD_FAKE_SHEETS_DIR")
+
+_SPREADSHEET = re.compile(re.escape(SPREADSHEETS_API_V4_BASE_URL) + r"/([^/]+)(?:/values(?::batchGet|/(.+)))?$")
+_DRIVE_FILE = re.compile(re.escape(DRIVE_FILES_API_V3_URL) + r"/([^/]+)$")
+
+
+def _env_float(name, default=0.0):
+    return float(os.environ.get(name, default))
+
+
+def _response(url, status, body, headers=None):
+    response = requests.Response()
+    response.status_code = status
+    response.url = url
+    response.headers.update({"Content-Type": "application/json", **(headers or {})})
+    response._content = json.dumps(body).encode("utf-8")
+    return response
+
+
+def _error(url, status, message, reason):
+    return _response(url, status, {"error": {"code": status, "message": message, "status": reason}})
+
+
+def _split_range(range_name):
+    """("Title", (first row, first col, last row, last col) or None) from "'Title'!A1:Z50" """
+    title, _, cells = range_name.partition("!")
+    if title.startswith("'") and title.endswith("'"):
+        title = title[1:-1].replace("''", "'")
+    if not cells:
+        return title, None
+    start, _, end = cells.partition(":")
+    first_row, first_col = a1_to_rowcol(start)
+    last_row, last_col = a1_to_rowcol(end or start)
+    return title, (first_row, first_col, last_row, last_col)
+
+
+class FakeSheetsSession:
+    """Read-only stand-in for the Sheets / Drive HTTP API, served from local CSV files.
+
+    Answers the calls the dashboard makes (spreadsheet metadata, values get
+    and batchGet, Drive file metadata) with the same JSON shapes as Google,
+    optionally after an injected delay, with 429s once a per-minute quota is
+    used up or at random, and with revisions that move when a CSV changes
+    or every revision_every seconds.
+    """
+
+    def __init__(self, root, latency=0.0, jitter=0.0, quota_per_minute=0, throttle_rate=0.0,
+                 revision_every=0.0, seed=None):
+        self.root = root
+        self.latency = latency
+        self.jitter = jitter
+        self.quota_per_minute = quota_per_minute
+        self.throttle_rate = throttle_rate
+        self.revision_every = revision_every
+        self.counters = Counter()
+        self._random = random.Random(seed)
+        self._recent = deque()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls, root=None):
+        seed = os.environ.get("DASHBOARD_FAKE_SHEETS_SEED")
+        return cls(
+            root or FAKE_SHEETS_DIR,
+            latency=_env_float("DASHBOARD_FAKE_SHEETS_LATENCY"),
+            jitter=_env_float("DASHBOARD_FAKE_SHEETS_JITTER"),
+            quota_per_minute=int(_env_float("DASHBOARD_FAKE_SHEETS_QUOTA")),
+            throttle_rate=_env_float("DASHBOARD_FAKE_SHEETS_THROTTLE_RATE"),
+            revision_every=_env_float("DASHBOARD_FAKE_SHEETS_REVISION_EVERY"),
+            seed=int(seed) if seed is not None else None,
+        )
+
+    # -- files --------------------------------------------------------------
+
+    def _sheet_dir(self, sheet_id):
+        path = os.path.join(self.root, sheet_id)
+        return path if os.path.isdir(path) else None
+
+    def _titles(self, sheet_dir):
+        return sorted(name[:-4] for name in os.listdir(sheet_dir) if name.endswith(".csv"))
+
+    def _grid(self, sheet_dir, title):
+        path = os.path.join(sheet_dir, title + ".csv")
+        if not os.path.exists(path):
+            return None
+        with open(path, newline="", encoding="utf-8") as f:
+            rows = list(csv.reader(f))
+        # Like Sheets: no trailing empty cells or rows
+        for row in rows:
+            while row and row[-1] == "":
+                row.pop()
+        while rows and not rows[-1]:
+            rows.pop()
+        return rows
+
+    def touch(self, sheet_id):
+        """Simulate an edit: move the spreadsheet's revision forward"""
+        sheet_dir = self._sheet_dir(sheet_id)
+        if sheet_dir is not None:
+            now = time.time()
+            for title in self._titles(sheet_dir):
+                os.utime(os.path.join(sheet_dir, title + ".csv"), (now, now))
+
+    def modified_time(self, sheet_dir):
+        modified = max([os.path.getmtime(os.path.join(sheet_dir, t + ".csv")) for t in self._titles(sheet_dir)]
+                       or [os.path.getmtime(sheet_dir)])
+        if self.revision_every:
+            modified = max(modified, time.time() // self.revision_every * self.revision_every)
+        stamp = datetime.datetime.fromtimestamp(modified, datetime.timezone.utc)
+        return stamp.strftime("%Y-%m-%dT%H:%M:%S.") + f"{stamp.microsecond // 1000:03d}Z"
+
+    # -- request handling ---------------------------------------------------
+
+    def _throttled(self):
+        with self._lock:
+            now = time.monotonic()
+            while self._recent and self._recent[0] < now - 60:
+                self._recent.popleft()
+            over_quota = self.quota_per_minute and len(self._recent) >= self.quota_per_minute
+            if not over_quota:
+                self._recent.append(now)
+            return over_quota or (self.throttle_rate and self._random.random() < self.throttle_rate)
+
+    def get(self, url, params=None, **kwargs):
+        with self._lock:
+            self.counters["requests"] += 1
+            delay = max(0.0, self.latency + self._random.uniform(-self.jitter, self.jitter))
+        if delay:
+            time.sleep(delay)
+        if self._throttled():
+            with self._lock:
+                self.counters["throttled"] += 1
+            return _error(url, 429, "Quota exceeded for quota metric 'Read requests' (fake backend).",
+                          "RESOURCE_EXHAUSTED")
+        params = params or {}
+
+        match = _DRIVE_FILE.match(url)
+        if match:
+            sheet_dir = self._sheet_dir(match.group(1))
+            if sheet_dir is None:
+                return _error(url, 404, "File not found.", "NOT_FOUND")
+            self.counters["drive_metadata"] += 1
+            return _response(url, 200, {"id": match.group(1), "name": match.group(1),
+                                        "modifiedTime": self.modified_time(sheet_dir)})
+
+        match = _SPREADSHEET.match(url)
+        if not match:
+            return _error(url, 404, "Unknown endpoint.", "NOT_FOUND")
+        sheet_id, single_range = match.group(1), match.group(2)
+        sheet_dir = self._sheet_dir(sheet_id)
+        if sheet_dir is None:
+            return _error(url, 404, "Requested entity was not found.", "NOT_FOUND")
+
+        if url.endswith(":batchGet"):
+            self.counters["values_batch_get"] += 1
+            ranges = params.get("ranges", [])
+            ranges = [ranges] if isinstance(ranges, str) else ranges
+            value_ranges = []
+            for range_name in ranges:
+                value_range, error = self._value_range(url, sheet_dir, range_name)
+                if error is not None:
+                    return error
+                value_ranges.append(value_range)
+            return _response(url, 200, {"spreadsheetId": sheet_id, "valueRanges": value_ranges})
+        if single_range is not None:
+            self.counters["values_get"] += 1
+            value_range, error = self._value_range(url, sheet_dir, unquote(single_range))
+            return error or _response(url, 200, value_range)
+
+        self.counters["metadata"] += 1
+        sheets = []
+        for index, title in enumerate(self._titles(sheet_dir)):
+            grid = self._grid(sheet_dir, title)
+            sheets.append({"properties": {
+                "sheetId": index, "title": title, "index": index, "sheetType": "GRID",
+                "gridProperties": {"rowCount": max(len(grid), 1000),
+                                   "columnCount": max([len(r) for r in grid] + [26])},
+            }})
+        return _response(url, 200, {"spreadsheetId": sheet_id, "properties": {"title": sheet_id},
+                                    "sheets": sheets})
+
+    def _value_range(self, url, sheet_dir, range_name):
+        title, bounds = _split_range(range_name)
+        grid = self._grid(sheet_dir, title)
+        if grid is None:
+            return None, _error(url, 400, f"Unable to parse range: {range_name}", "INVALID_ARGUMENT")
+        if bounds is not None:
+            first_row, first_col, last_row, last_col = bounds
+            grid = [row[first_col - 1:last_col] for row in grid[first_row - 1:last_row]]
+        value_range = {"range": range_name, "majorDimension": "ROWS"}
+        if grid:
+            value_range["values"] = grid
+        return value_range, None
+
+    def _read_only(self, url, *args, **kwargs):
+        return _error(url, 403, "The fake Sheets backend is read-only.", "PERMISSION_DENIED")
+
+    post = put = patch = delete = _read_only
+
+    def stats(self):
+        with self._lock:
+            return dict(self.counters)
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def fake_client():
+    """Process-wide gspread client backed by the fake session (through the shared gateway)"""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = GatewayClient(None, session=FakeSheetsSession.from_env())
+        return _client
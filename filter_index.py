@@ -0,0 +1,121 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from perf import cache_lookup, stage
+
+FILTER_FIELDS = ("pillar", "status", "owner")
+
+MAX_INDEXES = 8
+MAX_SELECTIONS = 256
+
+
+def _row_mask(n_rows, rows):
+    mask = np.zeros(n_rows, dtype=bool)
+    mask[rows] = True
+    return mask
+
+
+class FilterIndex:
+    """Categorical codes plus one packed bitmap per value for each filter column.
+
+    Combining multiselect choices is an OR of bitmaps within a column and an
+    AND across columns; the result is an array of row positions, so the
+    frame itself is never copied to filter it. With an OwnerIndex the owner
+    bitmaps are per individual owner, so a row naming several owners matches
+    any of them.
+    """
+
+    def __init__(self, df, col_map, fields=FILTER_FIELDS, owner_index=None):
+        self.n_rows = len(df)
+        self.codes = {}
+        self.bitmaps = {}
+        self._values = {}
+        self._memo = {}
+        self._lock = threading.Lock()
+        for field in fields:
+            if field not in col_map:
+                continue
+            codes, uniques = pd.factorize(df[col_map[field]], use_na_sentinel=True)
+            self.codes[field] = codes
+            if field == "owner" and owner_index is not None:
+                self.bitmaps[field] = {
+                    owner: np.packbits(_row_mask(self.n_rows, rows)) for owner, rows in owner_index.rows.items()
+                }
+                continue
+            self.bitmaps[field] = {
+                value: np.packbits(codes == code) for code, value in enumerate(uniques)
+            }
+
+    def values(self, field):
+        """Sorted distinct non-null values of a field (multiselect options)"""
+        if field not in self._values:
+            self._values[field] = sorted(self.bitmaps.get(field, {}))
+        return self._values[field]
+
+    def _field_mask(self, field, selected):
+        bitmaps = self.bitmaps.get(field)
+        if not bitmaps or not selected:
+            return None
+        selected = [v for v in set(selected) if v in bitmaps]
+        if len(selected) == len(bitmaps) and not (self.codes[field] < 0).any():
+            return None  # everything selected and no blanks: no-op
+        mask = np.zeros((self.n_rows + 7) // 8, dtype=np.uint8)
+        for value in selected:
+            mask |= bitmaps[value]
+        return mask
+
+    def select(self, pillars=None, statuses=None, owners=None):
+        """Row positions matching the selection; empty selections don't filter"""
+        key = tuple(frozenset(v) if v else None for v in (pillars, statuses, owners))
+        with self._lock:
+            positions = self._memo.get(key)
+        cache_lookup("filter", positions is not None)
+        if positions is not None:
+            return positions
+
+        with stage("filter"):
+            mask = None
+            for field, selected in zip(FILTER_FIELDS, (pillars, statuses, owners)):
+                field_mask = self._field_mask(field, selected)
+                if field_mask is not None:
+                    mask = field_mask if mask is None else mask & field_mask
+            if mask is None:
+                positions = np.arange(self.n_rows)
+            else:
+                positions = np.flatnonzero(np.unpackbits(mask, count=self.n_rows))
+        positions.flags.writeable = False  # shared between sessions through the memo
+
+        with self._lock:
+            if len(self._memo) >= MAX_SELECTIONS:
+                self._memo.clear()
+            self._memo[key] = positions
+        return positions
+
+
+_indexes = OrderedDict()
+_indexes_lock = threading.Lock()
+
+
+def filter_index_for(version, df, col_map, owner_index=None):
+    """FilterIndex for a data version, built once and shared by every session"""
+    key = (version, tuple(sorted(col_map.items())), owner_index is not None)
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is not None:
+            _indexes.move_to_end(key)
+            return index
+    index = FilterIndex(df, col_map, owner_index=owner_index)
+    with _indexes_lock:
+        _indexes[key] = index
+        while len(_indexes) > MAX_INDEXES:
+            _indexes.popitem(last=False)
+    return index
+
+
+def forget_version(version):
+    with _indexes_lock:
+        for key in [k for k in _indexes if k[0] == version]:
+            del _indexes[key]
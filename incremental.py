@@ -0,0 +1,139 @@
+import threading
+
+import pandas as pd
+
+from aggregates import AggregateEngine, cube_counts
+
+# Logical columns (col_map keys) that identify a tracker row
+KEY_FIELDS = ("pillar", "metric")
+
+
+class TrackerDiff:
+    """Row-level difference between two tracker snapshots"""
+
+    def __init__(self, added, removed, changed_old, changed_new):
+        self.added = added
+        self.removed = removed
+        self.changed_old = changed_old
+        self.changed_new = changed_new
+
+    def __bool__(self):
+        return bool(len(self.added) or len(self.removed) or len(self.changed_new))
+
+    def __repr__(self):
+        return (f"TrackerDiff(added={len(self.added)}, removed={len(self.removed)}, "
+                f"changed={len(self.changed_new)})")
+
+
+def _keyed(df, key_cols):
+    # Repeated keys are told apart by their order of appearance
+    keys = df[key_cols].astype(str)
+    occurrence = keys.groupby(key_cols, sort=False).cumcount()
+    arrays = [keys[c].to_numpy() for c in key_cols] + [occurrence.to_numpy()]
+    index = pd.MultiIndex.from_arrays(arrays)
+    return df.set_axis(index, axis=0)
+
+
+def diff_frames(old, new, key_cols):
+    """Diff two frames with identical columns, keyed by key_cols"""
+    old_k, new_k = _keyed(old, key_cols), _keyed(new, key_cols)
+    added = new_k.loc[new_k.index.difference(old_k.index)]
+    removed = old_k.loc[old_k.index.difference(new_k.index)]
+
+    common = new_k.index.intersection(old_k.index)
+    before, after = old_k.loc[common], new_k.loc[common]
+    # Compare as text so categorical / Arrow string columns and blanks compare cleanly
+    changed = (before.astype(str) != after.astype(str)).any(axis=1)
+    return TrackerDiff(added, removed, before[changed], after[changed])
+
+
+class DerivedCounts:
+    """Pillar x owner x status count cube that can be updated by deltas"""
+
+    def __init__(self, col_map):
+        self.col_map = col_map
+        self.total = 0
+        self.cube = {}
+        self._engine = None
+
+    @classmethod
+    def from_frame(cls, df, col_map):
+        counts = cls(col_map)
+        counts.add(df)
+        return counts
+
+    def add(self, rows, sign=1):
+        self.total += sign * len(rows)
+        for cell, n in cube_counts(rows, self.col_map).items():
+            value = self.cube.get(cell, 0) + sign * n
+            if value:
+                self.cube[cell] = value
+            else:
+                self.cube.pop(cell, None)
+        self._engine = None
+
+    def apply(self, diff):
+        """Fold a TrackerDiff into the counts without rescanning the whole frame"""
+        self.add(diff.removed, sign=-1)
+        self.add(diff.changed_old, sign=-1)
+        self.add(diff.changed_new)
+        self.add(diff.added)
+
+    def engine(self):
+        """Immutable AggregateEngine over the current counts"""
+        if self._engine is None:
+            self._engine = AggregateEngine(self.cube)
+        return self._engine
+
+
+class _SourceState:
+    def __init__(self, version, snapshot, col_map, derived):
+        self.version = version
+        self.snapshot = snapshot
+        self.col_map = col_map
+        self.derived = derived
+        self.last_diff = None
+
+
+class IncrementalTracker:
+    """Keeps the last snapshot per source and applies only row-level deltas to derived counts"""
+
+    def __init__(self):
+        self._sources = {}
+        self._lock = threading.Lock()
+
+    def ingest(self, source, version, df, col_map):
+        """Return the AggregateEngine for df, reusing the previous snapshot when possible"""
+        with self._lock:
+            return self._ingest(source, version, df, col_map).engine()
+
+    def _ingest(self, source, version, df, col_map):
+        state = self._sources.get(source)
+        if state is not None and state.version == version:
+            return state.derived
+
+        key_cols = [col_map.get(f) for f in KEY_FIELDS]
+        incremental = (
+            state is not None
+            and state.col_map == col_map
+            and list(state.snapshot.columns) == list(df.columns)
+            and all(key_cols)
+        )
+        if incremental:
+            diff = diff_frames(state.snapshot, df, key_cols)
+            state.derived.apply(diff)
+            state.last_diff = diff
+            state.version, state.snapshot = version, df
+            return state.derived
+
+        derived = DerivedCounts.from_frame(df, dict(col_map))
+        self._sources[source] = _SourceState(version, df, dict(col_map), derived)
+        return derived
+
+    def last_diff(self, source):
+        state = self._sources.get(source)
+        return state.last_diff if state else None
+
+
+# Process-wide tracker state shared by every Streamlit session
+incremental_tracker = IncrementalTracker()
@@ -0,0 +1,99 @@
+import re
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+# "MD,COO, Head Sourcing", "Head Sourcing/Category Pod Leads", "COO / CFO"; "&" and "and"
+# stay inside names such as "R&D Lead" or "Sales and Marketing Head"
+_OWNER_SEPARATORS = re.compile(r"\s*[,/;\n]\s*")
+
+MAX_INDEXES = 8
+
+
+def split_owners(value):
+    """Individual owner names in a combined "Who is Responsible" value"""
+    if pd.isna(value):
+        return ()
+    parts = [" ".join(p.split()) for p in _OWNER_SEPARATORS.split(str(value))]
+    parts = [p for p in parts if p]
+    return tuple(dict.fromkeys(parts)) or (str(value),)
+
+
+class OwnerIndex:
+    """Owner -> row id inverted index over the exploded "Who is Responsible" column.
+
+    Combined values are split once per distinct value (category), not per row;
+    spellings that differ only in case or spacing map to one owner.
+    """
+
+    def __init__(self, df, col_map):
+        self.n_rows = len(df)
+        self.members = {}     # raw value -> owners it names
+        self.raw_values = {}  # owner -> raw values naming it
+        self.rows = {}        # owner -> sorted row positions
+        if "owner" not in col_map:
+            self.owners = []
+            return
+
+        codes, uniques = pd.factorize(df[col_map["owner"]], use_na_sentinel=True)
+        canonical = {}
+        for raw in uniques:
+            owners = tuple(canonical.setdefault(o.casefold(), o) for o in split_owners(raw))
+            self.members[raw] = owners
+            for owner in owners:
+                self.raw_values.setdefault(owner, set()).add(raw)
+
+        # Group row positions by code once, then union the groups of every raw value
+        order = np.argsort(codes, kind="stable")
+        bounds = np.searchsorted(codes[order], np.arange(len(uniques) + 1))
+        by_code = {raw: order[bounds[i]:bounds[i + 1]] for i, raw in enumerate(uniques)}
+        for owner, raws in self.raw_values.items():
+            rows = np.sort(np.concatenate([by_code[raw] for raw in raws]))
+            rows.flags.writeable = False
+            self.rows[owner] = rows
+        self.owners = sorted(self.rows)
+
+    def expand(self, owners):
+        """Raw column values naming any of the owners (for filters and cube slices)"""
+        if not owners:
+            return []
+        return sorted({raw for owner in owners for raw in self.raw_values.get(owner, ())}, key=str)
+
+    def workload(self, owner_status, owners=None):
+        """Spread Owner / Status / Count rows keyed by raw values over individual owners"""
+        totals = {}
+        selected = set(owners) if owners else None
+        for raw, status, count in owner_status[["Owner", "Status", "Count"]].itertuples(index=False):
+            for owner in self.members.get(raw, split_owners(raw)):
+                if selected is None or owner in selected:
+                    totals[(owner, status)] = totals.get((owner, status), 0) + count
+        rows = sorted(((o, s, n) for (o, s), n in totals.items()), key=lambda r: (str(r[0]), str(r[1])))
+        return pd.DataFrame(rows, columns=["Owner", "Status", "Count"]).astype({"Count": int})
+
+
+_indexes = OrderedDict()
+_indexes_lock = threading.Lock()
+
+
+def owner_index_for(version, df, col_map):
+    """OwnerIndex for a data version, built once and shared by every session"""
+    key = (version, col_map.get("owner"))
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is not None:
+            _indexes.move_to_end(key)
+            return index
+    index = OwnerIndex(df, col_map)
+    with _indexes_lock:
+        _indexes[key] = index
+        while len(_indexes) > MAX_INDEXES:
+            _indexes.popitem(last=False)
+    return index
+
+
+def forget_version(version):
+    with _indexes_lock:
+        for key in [k for k in _indexes if k[0] == version]:
+            del _indexes[key]
@@ -0,0 +1,186 @@
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+import pandas as pd
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+# Prometheus text-format file (e.g. for node_exporter's textfile collector); unset disables it
+METRICS_FILE = os.environ.get("DASHBOARD_METRICS_FILE")
+METRICS_INTERVAL = float(os.environ.get("DASHBOARD_METRICS_INTERVAL", 15))
+
+# Show the sidebar panel to everyone; otherwise only with ?perf=1 in the URL
+PERF_PANEL = os.environ.get("DASHBOARD_PERF_PANEL", "") not in ("", "0")
+
+# Histogram bucket upper bounds, in seconds
+BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+_RERUN_KEY = "_perf_rerun"
+_STARTED_KEY = "_perf_started"
+
+
+def _fragment_only_run():
+    """True when this script run re-executes fragments only, not the whole script"""
+    ctx = get_script_run_ctx(suppress_warning=True)
+    return ctx is not None and bool(ctx.fragment_ids_this_run)
+
+
+def _session_stages():
+    """The current rerun's [(stage, seconds)] list, or None outside a script run"""
+    if get_script_run_ctx(suppress_warning=True) is None:
+        return None
+    return st.session_state.get(_RERUN_KEY)
+
+
+class PerfMetrics:
+    """Process-wide stage timings and cache hit/miss counts, shared by every session"""
+
+    def __init__(self):
+        self._stages = {}  # stage -> [count, total seconds, per-bucket counts]
+        self._caches = {}  # cache -> [hits, misses]
+        self._lock = threading.Lock()
+        self._written_at = 0.0
+
+    def record(self, name, seconds):
+        with self._lock:
+            entry = self._stages.get(name)
+            if entry is None:
+                entry = self._stages[name] = [0, 0.0, [0] * len(BUCKETS)]
+            entry[0] += 1
+            entry[1] += seconds
+            for i, bound in enumerate(BUCKETS):
+                if seconds <= bound:
+                    entry[2][i] += 1
+        stages = _session_stages()
+        if stages is not None:
+            stages.append((name, seconds))
+
+    @contextmanager
+    def stage(self, name):
+        """Time the enclosed block as one run of stage name"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def cache(self, name, hit):
+        with self._lock:
+            counts = self._caches.setdefault(name, [0, 0])
+            counts[0 if hit else 1] += 1
+
+    def stages(self):
+        with self._lock:
+            return {name: (count, total) for name, (count, total, _) in self._stages.items()}
+
+    def caches(self):
+        with self._lock:
+            return {name: tuple(counts) for name, counts in self._caches.items()}
+
+    def prometheus(self):
+        """All metrics, plus the Sheets gateway counters, in Prometheus text format"""
+        from sheets_gateway import gateway
+
+        with self._lock:
+            stages = {name: (count, total, list(buckets)) for name, (count, total, buckets) in self._stages.items()}
+            caches = dict(self._caches)
+        lines = ["# HELP dashboard_stage_seconds Time spent in each dashboard pipeline stage.",
+                 "# TYPE dashboard_stage_seconds histogram"]
+        for name, (count, total, buckets) in sorted(stages.items()):
+            for bound, n in zip(BUCKETS, buckets):
+                lines.append(f'dashboard_stage_seconds_bucket{{stage="{name}",le="{bound}"}} {n}')
+            lines.append(f'dashboard_stage_seconds_bucket{{stage="{name}",le="+Inf"}} {count}')
+            lines.append(f'dashboard_stage_seconds_sum{{stage="{name}"}} {total:.6f}')
+            lines.append(f'dashboard_stage_seconds_count{{stage="{name}"}} {count}')
+        lines += ["# HELP dashboard_cache_lookups_total Cache lookups by cache and result.",
+                  "# TYPE dashboard_cache_lookups_total counter"]
+        for name, (hits, misses) in sorted(caches.items()):
+            lines.append(f'dashboard_cache_lookups_total{{cache="{name}",result="hit"}} {hits}')
+            lines.append(f'dashboard_cache_lookups_total{{cache="{name}",result="miss"}} {misses}')
+        api = gateway.stats()
+        lines += ["# HELP dashboard_sheets_api_total Sheets API calls through the gateway, by outcome.",
+                  "# TYPE dashboard_sheets_api_total counter"]
+        for kind in ("calls", "requests", "coalesced", "retries", "throttled", "errors"):
+            lines.append(f'dashboard_sheets_api_total{{kind="{kind}"}} {api[kind]}')
+        lines += ["# HELP dashboard_sheets_api_wait_seconds_total Time spent waiting for Sheets API quota.",
+                  "# TYPE dashboard_sheets_api_wait_seconds_total counter",
+                  f"dashboard_sheets_api_wait_seconds_total {api['wait_seconds']:.6f}"]
+        return "\n".join(lines) + "\n"
+
+    def write(self, path, interval=METRICS_INTERVAL):
+        """Rewrite the metrics file at most once per interval; readers never see a partial file"""
+        with self._lock:
+            now = time.monotonic()
+            if now - self._written_at < interval:
+                return
+            self._written_at = now
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            f.write(self.prometheus())
+        os.replace(tmp, path)
+
+
+# Process-wide metrics shared by every Streamlit session
+metrics = PerfMetrics()
+
+
+def stage(name):
+    """Context manager timing one pipeline stage"""
+    return metrics.stage(name)
+
+
+def cache_lookup(name, hit):
+    """Count a hit or miss on the named cache"""
+    metrics.cache(name, hit)
+
+
+def start_rerun(kind="rerun"):
+    """Call at the top of a script: starts this session's per-rerun stage list.
+
+    Call it with kind="fragment" at the top of an st.fragment too; it only
+    takes effect when the fragment reruns on its own, since a full rerun
+    already times it.
+    """
+    if kind == "fragment" and not _fragment_only_run():
+        return
+    st.session_state[_RERUN_KEY] = []
+    st.session_state[_STARTED_KEY] = time.perf_counter()
+
+
+def finish_rerun(kind="rerun"):
+    """Call at the end of a script (or fragment): records the rerun, writes the metrics file, shows the panel"""
+    fragment = kind == "fragment"
+    if fragment and not _fragment_only_run():
+        return
+    started = st.session_state.get(_STARTED_KEY)
+    if started is not None:
+        metrics.record("fragment_rerun" if fragment else "rerun", time.perf_counter() - started)
+    if METRICS_FILE:
+        metrics.write(METRICS_FILE)
+    if PERF_PANEL or st.query_params.get("perf") == "1":
+        # Fragments can't write to the sidebar, so their panel goes at the end of the fragment
+        debug_panel(st.container() if fragment else st.sidebar, "This fragment rerun" if fragment else "This rerun")
+
+
+def debug_panel(parent=None, title="This rerun"):
+    """Breakdown of the last rerun, cache hit rates and Sheets API usage (in the sidebar by default)"""
+    from sheets_gateway import gateway
+
+    stages = st.session_state.get(_RERUN_KEY) or []
+    with (parent or st.sidebar).expander("⏱️ Performance", expanded=True):
+        if stages:
+            st.caption(title)
+            st.dataframe(pd.DataFrame([(name, round(seconds * 1000, 2)) for name, seconds in stages],
+                                      columns=["Stage", "ms"]), hide_index=True, use_container_width=True)
+        caches = metrics.caches()
+        if caches:
+            st.caption("Caches (process)")
+            st.dataframe(pd.DataFrame([(name, hits, misses, f"{hits / (hits + misses):.0%}")
+                                       for name, (hits, misses) in sorted(caches.items())],
+                                      columns=["Cache", "Hits", "Misses", "Hit rate"]),
+                         hide_index=True, use_container_width=True)
+        api = gateway.stats()
+        st.caption(f"Sheets API: {api['calls']} calls · {api['requests']} requests · "
+                   f"{api['coalesced']} coalesced · {api['retries']} retried · {api['errors']} errors")
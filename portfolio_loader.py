@@ -0,0 +1,120 @@
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import pandas as pd
+
+from sheet_cache import sheet_cache
+from sheets_client import sheet_id_from_url
+from sheets_loader import fetch_worksheets
+from snapshot_store import load_frames
+
+MAX_WORKERS = int(os.environ.get("DASHBOARD_LOAD_WORKERS", 8))
+SHEET_TIMEOUT = float(os.environ.get("DASHBOARD_SHEET_TIMEOUT", 30))
+
+# Column added to the merged frame naming the spreadsheet each row came from
+SOURCE_COLUMN = "Source"
+
+
+class SheetLoad:
+    """Outcome of loading one spreadsheet of a portfolio"""
+
+    def __init__(self, source, url):
+        self.source = source
+        self.url = url
+        self.sheet_id = None
+        self.status = "pending"  # ok | snapshot | missing | error | timeout
+        self.rows = 0
+        self.seconds = None
+        self.error = None
+        self.started = None
+
+
+def parse_sources(text):
+    """(label, url) pairs from one "url" or "label | url" per line"""
+    sources = []
+    for line in (text or "").splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        label, _, url = line.rpartition("|")
+        sources.append((label.strip() or None, url.strip()))
+    return sources
+
+
+def _load_one(load, worksheet_name):
+    """Fetch one sheet and return (status, frame, error); only the start time is set on load"""
+    load.started = time.monotonic()
+    sheet_id = load.sheet_id
+    key = (sheet_id, (worksheet_name,), None)
+    try:
+        frames = sheet_cache.get(key, lambda: fetch_worksheets(sheet_id, [worksheet_name]))
+        status, error = "ok", None
+    except Exception as e:
+        # Partial results: fall back to the last snapshot of this sheet, if any
+        frames, _ = load_frames(sheet_id, [worksheet_name])
+        status, error = ("snapshot" if frames is not None else "error"), str(e)
+    df = (frames or {}).get(worksheet_name)
+    if df is None and status == "ok":
+        status, error = "missing", f"Worksheet '{worksheet_name}' not found (or no credentials)"
+    return status, df, error
+
+
+def load_portfolio(sources, worksheet_name, max_workers=MAX_WORKERS, timeout=SHEET_TIMEOUT):
+    """Load one worksheet from many spreadsheets concurrently.
+
+    sources is a list of (label, url) pairs. At most max_workers sheets are
+    fetched at once and each gets timeout seconds from when its fetch
+    starts; sheets that fail or time out are reported, not raised. Returns
+    (merged frame tagged with SOURCE_COLUMN or None, [SheetLoad]).
+    """
+    loads = [SheetLoad(label, url) for label, url in sources]
+    if not loads:
+        return None, loads
+    for load in loads:
+        try:
+            load.sheet_id = sheet_id_from_url(load.url)
+        except IndexError:
+            load.status, load.error = "error", "Invalid Google Sheet URL"
+        load.source = load.source or load.sheet_id
+
+    executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(loads))),
+                                  thread_name_prefix="portfolio-load")
+    pending = {executor.submit(_load_one, load, worksheet_name): load
+               for load in loads if load.status == "pending"}
+    frames = []
+    try:
+        while pending:
+            done, _ = wait(pending, timeout=0.25, return_when=FIRST_COMPLETED)
+            now = time.monotonic()
+            for future in done:
+                load = pending.pop(future)
+                load.seconds = now - load.started if load.started else None
+                if future.exception() is not None:
+                    load.status, load.error = "error", str(future.exception())
+                    continue
+                load.status, df, load.error = future.result()
+                if df is not None:
+                    load.rows = len(df)
+                    df = df.rename(columns=lambda c: str(c).strip())
+                    frames.append(df.assign(**{SOURCE_COLUMN: load.source}))
+            for future, load in list(pending.items()):
+                if load.started is not None and now - load.started > timeout:
+                    # Abandon it; the worker finishes in the background and its result is dropped
+                    pending.pop(future)
+                    load.status, load.seconds = "timeout", now - load.started
+                    load.error = f"No response within {timeout:.0f}s"
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    merged = pd.concat(frames, ignore_index=True, sort=False) if frames else None
+    return merged, loads
+
+
+def load_report(loads):
+    """Per-sheet status / rows / latency table for display"""
+    return pd.DataFrame(
+        [(l.source or l.url, l.status, l.rows, None if l.seconds is None else round(l.seconds, 2), l.error)
+         for l in loads],
+        columns=["Source", "Status", "Rows", "Seconds", "Error"],
+    )
@@ -0,0 +1,83 @@
+import threading
+import time
+
+from change_detector import change_detector
+from sheet_cache import sheet_cache
+from sheets_client import get_client
+from sheets_loader import fetch_worksheets
+
+REFRESH_INTERVAL = 30
+
+# Pollers stop once no session has asked for them for this long
+IDLE_TIMEOUT = 300
+
+
+class _Poller:
+    def __init__(self, poll):
+        self.poll = poll
+        self.latest = None
+        self.last_seen = time.time()
+        self.error = None
+
+
+class RefreshScheduler:
+    """One background poller per key, shared by every session that watches it"""
+
+    def __init__(self, interval=REFRESH_INTERVAL, idle_timeout=IDLE_TIMEOUT):
+        self.interval = interval
+        self.idle_timeout = idle_timeout
+        self._pollers = {}
+        self._lock = threading.Lock()
+
+    def ensure(self, key, poll):
+        """Start polling key with poll() unless a poller already runs; returns its latest result"""
+        with self._lock:
+            poller = self._pollers.get(key)
+            if poller is None:
+                poller = _Poller(poll)
+                self._pollers[key] = poller
+                threading.Thread(target=self._run, args=(key, poller), daemon=True).start()
+            poller.last_seen = time.time()
+            return poller.latest
+
+    def latest(self, key):
+        with self._lock:
+            poller = self._pollers.get(key)
+            if poller is None:
+                return None
+            poller.last_seen = time.time()
+            return poller.latest
+
+    def _run(self, key, poller):
+        while True:
+            try:
+                poller.latest = poller.poll()
+                poller.error = None
+            except Exception as e:
+                poller.error = str(e)
+            time.sleep(self.interval)
+            with self._lock:
+                if time.time() - poller.last_seen > self.idle_timeout:
+                    del self._pollers[key]
+                    return
+
+
+def watch_sheet(sheet_id, worksheet_names, scheduler=None):
+    """Keep the cache warm for a spreadsheet; returns the latest revision seen by its poller"""
+    names = tuple(worksheet_names)
+
+    def poll():
+        client = get_client()
+        if client is None:
+            return None
+        revision = change_detector.check(client, sheet_id, names, force=True)
+        cache_key = (sheet_id, names, revision)
+        if revision is not None and cache_key not in sheet_cache:
+            sheet_cache.put(cache_key, fetch_worksheets(sheet_id, names, revision))
+        return revision
+
+    return (scheduler or refresh_scheduler).ensure((sheet_id, names), poll)
+
+
+# Process-wide scheduler shared by every Streamlit session
+refresh_scheduler = RefreshScheduler()
@@ -0,0 +1,132 @@
+import threading
+from collections import OrderedDict
+from functools import cached_property, lru_cache
+
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401  (enables the compact string dtype)
+    TEXT_DTYPE = "string[pyarrow]"
+except ImportError:
+    TEXT_DTYPE = None
+
+# Low-cardinality tracker columns stored as pandas categoricals
+CATEGORICAL_FIELDS = ("pillar", "status", "frequency", "owner", "target")
+
+# Free-text columns stored as Arrow-backed strings when pyarrow is available
+TEXT_FIELDS = ("metric", "action")
+
+MAX_SCHEMAS = 8
+
+# "≥ 30 meetings in 90 -120 days", "30–50 SKUs/category", "70% T&A cut", "≤ 3× EBITDA"
+_TARGET_PATTERN = (
+    r"^\s*(?P<comparator>[≥≤<>]=?)?\s*"
+    r"(?P<low>\d+(?:\.\d+)?)"
+    r"(?:\s*[–-]\s*(?P<high>\d+(?:\.\d+)?))?"
+    r"\s*(?P<unit>%|×)?"
+)
+_DEADLINE_PATTERN = r"(?P<quarter>Q[1-4])?\s*FY\s*(?P<fiscal_year>\d{2,4})"
+
+_PERIOD_DAYS = {"weekly": 7, "monthly": 30, "quarterly": 91, "annual": 365, "yearly": 365}
+
+
+@lru_cache(maxsize=64)
+def resolve_columns(columns):
+    """Map logical tracker fields to column names (columns is a tuple of names)"""
+    col_map = {}
+    for c in columns:
+        lc = c.lower()
+        if "strategic pillar" in lc or "pillar" in lc:
+            col_map["pillar"] = c
+        elif "kpi" in lc or "metric" in lc:
+            col_map["metric"] = c
+        elif "responsible" in lc or "owner" in lc:
+            col_map["owner"] = c
+        elif "status" in lc:
+            col_map["status"] = c
+        elif "frequency" in lc:
+            col_map["frequency"] = c
+        elif "tat" in lc or "target" in lc:
+            col_map["target"] = c
+        elif "action" in lc:
+            col_map["action"] = c
+    return col_map
+
+
+def _by_codes(column, parsed):
+    """Spread per-category parse results back onto the rows of a categorical column"""
+    # Missing values have code -1, which reindexes to an all-NaN row
+    return parsed.reindex(column.cat.codes.to_numpy()).set_axis(column.index, axis=0)
+
+
+def parse_targets(column):
+    """Structured fields for "Max out Target TAT": comparator, low, high, unit, quarter, fiscal_year"""
+    categories = pd.Series(column.cat.categories.astype(str))
+    parsed = categories.str.extract(_TARGET_PATTERN)
+    parsed[["low", "high"]] = parsed[["low", "high"]].astype(float)
+    parsed = parsed.join(categories.str.extract(_DEADLINE_PATTERN))
+    parsed["fiscal_year"] = pd.to_numeric(parsed["fiscal_year"], errors="coerce")
+    return _by_codes(column, parsed)
+
+
+def parse_frequencies(column):
+    """Structured fields for "Frequency": period name and cadence in days"""
+    categories = pd.Series(column.cat.categories.astype(str))
+    day = pd.to_numeric(categories.str.extract(r"(?i)^\s*day\s*(\d+)")[0], errors="coerce")
+    period = categories.str.lower().str.extract(r"(weekly|monthly|quarterly|annual|yearly)")[0]
+    parsed = pd.DataFrame({
+        "period": period.where(day.isna(), "day"),
+        "days": day.fillna(period.map(_PERIOD_DAYS)),
+    })
+    return _by_codes(column, parsed)
+
+
+class TrackerSchema:
+    """Typed tracker frame plus its resolved column mapping and parsed fields"""
+
+    def __init__(self, df):
+        df = df.rename(columns=lambda c: str(c).strip())
+        self.col_map = dict(resolve_columns(tuple(df.columns)))
+        typed = {}
+        for field in CATEGORICAL_FIELDS:
+            if field in self.col_map:
+                typed[self.col_map[field]] = df[self.col_map[field]].astype("category")
+        if TEXT_DTYPE:
+            for field in TEXT_FIELDS:
+                if field in self.col_map:
+                    typed[self.col_map[field]] = df[self.col_map[field]].astype(str).where(
+                        df[self.col_map[field]].notna()).astype(TEXT_DTYPE)
+        self.df = df.assign(**typed)
+
+    # Parsed on first use only, so versions nobody asks about don't pay for them
+    @cached_property
+    def targets(self):
+        return parse_targets(self.df[self.col_map["target"]]) if "target" in self.col_map else None
+
+    @cached_property
+    def frequencies(self):
+        return parse_frequencies(self.df[self.col_map["frequency"]]) if "frequency" in self.col_map else None
+
+
+_schemas = OrderedDict()
+_schemas_lock = threading.Lock()
+
+
+def schema_for(version, df):
+    """TrackerSchema for a data version, built once and shared by every session"""
+    with _schemas_lock:
+        schema = _schemas.get(version)
+        if schema is not None:
+            _schemas.move_to_end(version)
+            return schema
+    schema = TrackerSchema(df)
+    with _schemas_lock:
+        _schemas[version] = schema
+        while len(_schemas) > MAX_SCHEMAS:
+            _schemas.popitem(last=False)
+    return schema
+
+
+def forget_version(version):
+    with _schemas_lock:
+        _schemas.pop(version, None)
@@ -0,0 +1,135 @@
+import bisect
+import re
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from perf import cache_lookup, stage
+
+# Logical columns (col_map keys) covered by the search box
+SEARCH_FIELDS = ("metric", "action")
+
+MAX_INDEXES = 8
+MAX_QUERIES = 256
+
+# Joins the searched fields; query normalization splits on it, so no term can span two fields
+_FIELD_SEPARATOR = "\x1f"
+
+_TOKEN = re.compile(r"\w+")
+_EMPTY = np.array([], dtype=np.int64)
+_EMPTY.flags.writeable = False
+
+
+def normalize(text):
+    return " ".join(str(text).casefold().split())
+
+
+class SearchIndex:
+    """Trigram + token index over the searchable tracker columns.
+
+    Query syntax: whitespace-separated terms that must all match (AND). A term
+    matches as a case-insensitive substring; a term ending in '*' only matches
+    at the start of a word (prefix search).
+    """
+
+    def __init__(self, df, col_map, fields=SEARCH_FIELDS):
+        columns = [col_map[f] for f in fields if f in col_map]
+        self.n_rows = len(df)
+        if columns:
+            fields = [df[c].fillna("").astype(str).map(normalize) for c in columns]
+            self.texts = [_FIELD_SEPARATOR.join(values) for values in zip(*fields)]
+        else:
+            self.texts = [""] * self.n_rows
+
+        trigrams, tokens = {}, {}
+        for row, text in enumerate(self.texts):
+            for gram in {text[i:i + 3] for i in range(len(text) - 2)}:
+                trigrams.setdefault(gram, []).append(row)
+            for token in set(_TOKEN.findall(text)):
+                tokens.setdefault(token, []).append(row)
+        self.trigrams = {g: np.array(rows, dtype=np.int64) for g, rows in trigrams.items()}
+        self.tokens = sorted(tokens)
+        self.token_rows = [np.array(tokens[t], dtype=np.int64) for t in self.tokens]
+
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _substring(self, term):
+        if len(term) < 3:
+            # Too short for trigrams: scan the pre-normalized texts
+            return np.array([i for i, t in enumerate(self.texts) if term in t], dtype=np.int64)
+        candidates = None
+        for gram in {term[i:i + 3] for i in range(len(term) - 2)}:
+            rows = self.trigrams.get(gram)
+            if rows is None:
+                return _EMPTY
+            candidates = rows if candidates is None else np.intersect1d(candidates, rows, assume_unique=True)
+        if len(term) == 3:
+            return candidates
+        return np.array([i for i in candidates if term in self.texts[i]], dtype=np.int64)
+
+    def _prefix(self, prefix):
+        start = bisect.bisect_left(self.tokens, prefix)
+        end = bisect.bisect_left(self.tokens, prefix + "\U0010ffff")
+        if start == end:
+            return _EMPTY
+        return np.unique(np.concatenate(self.token_rows[start:end]))
+
+    def search(self, query):
+        """Sorted row positions matching the query (all rows for an empty query)"""
+        query = normalize(query)
+        with self._lock:
+            cached = query in self._cache
+            if cached:
+                self._cache.move_to_end(query)
+                rows = self._cache[query]
+        cache_lookup("search", cached)
+        if cached:
+            return rows
+
+        rows = None
+        with stage("search"):
+            for term in query.split():
+                if term.endswith("*") and len(term) > 1:
+                    hits = self._prefix(term[:-1])
+                else:
+                    hits = self._substring(term)
+                rows = hits if rows is None else np.intersect1d(rows, hits, assume_unique=True)
+                if not len(rows):
+                    break
+        if rows is None:
+            rows = np.arange(self.n_rows)
+        rows.flags.writeable = False
+
+        with self._lock:
+            self._cache[query] = rows
+            while len(self._cache) > MAX_QUERIES:
+                self._cache.popitem(last=False)
+        return rows
+
+
+_indexes = OrderedDict()
+_indexes_lock = threading.Lock()
+
+
+def search_index_for(version, df, col_map):
+    """SearchIndex for a data version, built once and shared by every session"""
+    key = (version, tuple(sorted(col_map.items())))
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is not None:
+            _indexes.move_to_end(key)
+            return index
+    index = SearchIndex(df, col_map)
+    with _indexes_lock:
+        _indexes[key] = index
+        while len(_indexes) > MAX_INDEXES:
+            _indexes.popitem(last=False)
+    return index
+
+
+def forget_version(version):
+    with _indexes_lock:
+        for key in [k for k in _indexes if k[0] == version]:
+            del _indexes[key]
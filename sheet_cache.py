@@ -0,0 +1,113 @@
+import itertools
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from perf import cache_lookup
+
+DEFAULT_TTL = float(os.environ.get("DASHBOARD_CACHE_TTL", 600))
+DEFAULT_MAX_ENTRIES = int(os.environ.get("DASHBOARD_CACHE_MAX_ENTRIES", 32))
+
+logger = logging.getLogger(__name__)
+
+
+class SheetCache:
+    """TTL + LRU cache for worksheet frames that serves stale data while it refreshes"""
+
+    def __init__(self, ttl=DEFAULT_TTL, max_entries=DEFAULT_MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # key -> (loaded_at, value)
+        self._refreshing = {}  # key -> generation of its in-flight refresh
+        self._generations = itertools.count()
+        self._invalidation_hooks = []
+        self._lock = threading.Lock()
+
+    def get(self, key, loader, refresher=None):
+        """Return the cached value for key, calling loader() only when needed.
+
+        A missing entry is loaded synchronously. An expired entry is returned
+        as-is while refresher() (default: loader) runs on a background thread
+        to replace it.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            cache_lookup("sheet", entry is not None)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                loaded_at, value = entry
+                if time.time() - loaded_at > self.ttl:
+                    self._refresh_async_locked(key, refresher or loader)
+                return value
+
+        value = loader()
+        self.put(key, value)
+        return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._put_locked(key, value)
+
+    def _put_locked(self, key, value):
+        # Failed loads come back as None and are never cached
+        if value is None:
+            return
+        self._entries[key] = (time.time(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def refresh_async(self, key, loader):
+        """Run loader() on a background thread and cache its result, once per key at a time"""
+        with self._lock:
+            self._refresh_async_locked(key, loader)
+
+    def _refresh_async_locked(self, key, loader):
+        if key not in self._refreshing:
+            generation = self._refreshing[key] = next(self._generations)
+            threading.Thread(target=self._refresh, args=(key, loader, generation), daemon=True).start()
+
+    def _refresh(self, key, loader, generation):
+        try:
+            value = loader()
+        except Exception:
+            # Keep serving the entry we have; the next expired read tries again
+            logger.warning("Background refresh of %r failed", key, exc_info=True)
+            value = None
+        with self._lock:
+            # invalidate() since this refresh started: its result is stale
+            if self._refreshing.get(key) != generation:
+                return
+            del self._refreshing[key]
+            self._put_locked(key, value)
+
+    def on_invalidate(self, hook):
+        """Call hook(sheet_id) on every invalidate(), for caches kept next to this one"""
+        self._invalidation_hooks.append(hook)
+
+    def invalidate(self, sheet_id=None):
+        """Drop every entry, or only those belonging to one spreadsheet"""
+        for hook in self._invalidation_hooks:
+            hook(sheet_id)
+        with self._lock:
+            if sheet_id is None:
+                self._entries.clear()
+                self._refreshing.clear()
+            else:
+                for key in [k for k in self._entries if k[0] == sheet_id]:
+                    del self._entries[key]
+                for key in [k for k in self._refreshing if k[0] == sheet_id]:
+                    del self._refreshing[key]
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+
+# Process-wide cache shared by every Streamlit session
+sheet_cache = SheetCache()
@@ -0,0 +1,92 @@
+import datetime
+import json
+import os
+import threading
+
+import gspread
+from google.auth.transport.requests import Request
+from google.oauth2.service_account import Credentials
+
+from fake_sheets import FAKE_SHEETS_DIR, fake_client
+from perf import stage
+from sheets_gateway import GatewayClient
+
+SCOPES = ['https://spreadsheets.google.com/feeds', 'https://www.googleapis.com/auth/drive']
+CREDENTIALS_FILE = 'google-credentials.json'
+
+# Refresh the access token this many seconds before Google says it expires
+TOKEN_REFRESH_MARGIN = 300
+
+SERVICE_ACCOUNT_KEYS = [
+    "type", "project_id", "private_key_id", "private_key", "client_email", "client_id",
+    "auth_uri", "token_uri", "auth_provider_x509_cert_url", "client_x509_cert_url",
+]
+
+# One authorized client per service account, shared by every session in the process
+_pool = {}
+_pool_lock = threading.Lock()
+
+
+class _PooledClient:
+    def __init__(self, creds):
+        self.creds = creds
+        # Every request is rate-limited, retried and coalesced by the shared gateway
+        self.client = gspread.authorize(creds, client_factory=GatewayClient)
+        self.lock = threading.Lock()
+
+    def needs_refresh(self):
+        if not self.creds.token or self.creds.expiry is None:
+            return True
+        # google-auth stores expiry as a naive UTC datetime
+        remaining = self.creds.expiry - datetime.datetime.utcnow()
+        return remaining.total_seconds() < TOKEN_REFRESH_MARGIN
+
+    def get(self):
+        with self.lock:
+            if self.needs_refresh():
+                with stage("authorize"):
+                    self.creds.refresh(Request())
+            return self.client
+
+
+def get_service_account_info():
+    """Return service-account info from Streamlit secrets, else the local credentials file"""
+    try:
+        import streamlit as st
+        section = st.secrets["gcp_service_account"]
+        return {key: section[key] for key in SERVICE_ACCOUNT_KEYS}
+    except Exception:
+        pass
+
+    if os.path.exists(CREDENTIALS_FILE):
+        with open(CREDENTIALS_FILE) as f:
+            return json.load(f)
+    return None
+
+
+def sheet_id_from_url(sheet_url):
+    """Extract the spreadsheet key from a Google Sheets URL"""
+    return sheet_url.split('/d/')[1].split('/')[0]
+
+
+def _pool_key(info):
+    return (info.get("client_email"), info.get("private_key_id"))
+
+
+def get_client(service_account_info=None):
+    """Return a pooled, authorized gspread client, or None when no credentials exist"""
+    if FAKE_SHEETS_DIR and service_account_info is None:
+        # Local CSV-backed stand-in for offline development and load tests
+        return fake_client()
+    info = service_account_info or get_service_account_info()
+    if info is None:
+        return None
+
+    key = _pool_key(info)
+    with _pool_lock:
+        pooled = _pool.get(key)
+        if pooled is None:
+            creds = Credentials.from_service_account_info(info, scopes=SCOPES)
+            pooled = _PooledClient(creds)
+            _pool[key] = pooled
+    return pooled.get()
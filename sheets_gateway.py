@@ -0,0 +1,162 @@
+import os
+import random
+import threading
+import time
+from collections import deque
+
+import gspread
+from gspread.exceptions import APIError
+
+from perf import stage
+
+# Google's default read quota is 60 requests per minute per user; stay under it
+RATE_PER_MINUTE = float(os.environ.get("DASHBOARD_SHEETS_RATE", 60))
+BURST = int(os.environ.get("DASHBOARD_SHEETS_BURST", 10))
+
+MAX_RETRIES = 5
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 32.0
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    """Blocking token bucket: rate tokens per second, up to capacity banked"""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take one token, sleeping until one is available; returns the seconds waited"""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return waited
+                delay = (1 - self.tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+class _Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SheetsGateway:
+    """Single path for every Sheets / Drive API call made by the dashboard.
+
+    Rate-limits with a token bucket, retries 429 and 5xx answers with
+    exponential backoff (honouring Retry-After), and coalesces identical
+    concurrent GETs so they share one in-flight request.
+    """
+
+    def __init__(self, rate_per_minute=RATE_PER_MINUTE, burst=BURST, max_retries=MAX_RETRIES):
+        self.bucket = TokenBucket(rate_per_minute / 60.0, burst)
+        self.max_retries = max_retries
+        self.counters = {"calls": 0, "requests": 0, "coalesced": 0, "retries": 0,
+                         "throttled": 0, "errors": 0, "wait_seconds": 0.0}
+        self._recent = deque()  # send times of the last minute's requests
+        self._inflight = {}
+        self._lock = threading.Lock()
+
+    def _count(self, name, amount=1):
+        with self._lock:
+            self.counters[name] += amount
+
+    def _send(self, send):
+        for attempt in range(self.max_retries + 1):
+            self._count("wait_seconds", self.bucket.acquire())
+            with self._lock:
+                self.counters["requests"] += 1
+                self._recent.append(time.monotonic())
+            try:
+                with stage("sheets_request"):
+                    return send()
+            except APIError as e:
+                status = getattr(e.response, "status_code", None)
+                if status == 429:
+                    self._count("throttled")
+                if status not in RETRY_STATUSES or attempt == self.max_retries:
+                    self._count("errors")
+                    raise
+                retry_after = e.response.headers.get("Retry-After")
+                try:
+                    delay = float(retry_after)
+                except (TypeError, ValueError):
+                    delay = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt) * (0.5 + random.random() / 2)
+                self._count("retries")
+                time.sleep(delay)
+
+    def call(self, key, send):
+        """Run send() through the limiter; callers passing the same key concurrently share one result"""
+        self._count("calls")
+        if key is None:
+            return self._send(send)
+
+        with self._lock:
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = _Flight()
+        if not leader:
+            self._count("coalesced")
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = self._send(send)
+            return flight.result
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            flight.done.set()
+
+    def stats(self):
+        """Counter snapshot plus the number of requests sent in the last minute"""
+        with self._lock:
+            cutoff = time.monotonic() - 60
+            while self._recent and self._recent[0] < cutoff:
+                self._recent.popleft()
+            return {**self.counters, "last_minute": len(self._recent),
+                    "quota_per_minute": self.bucket.rate * 60}
+
+
+# Process-wide gateway shared by every session and background refresh
+gateway = SheetsGateway()
+
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+class GatewayClient(gspread.Client):
+    """gspread client whose every HTTP request goes through the shared gateway"""
+
+    def request(self, method, endpoint, params=None, data=None, json=None, files=None, headers=None):
+        def send():
+            return super(GatewayClient, self).request(
+                method, endpoint, params=params, data=data, json=json, files=files, headers=headers)
+        # Only side-effect-free reads are coalesced
+        key = None
+        if method == "get" and data is None and json is None and files is None:
+            key = (id(self), endpoint, _freeze(params), _freeze(headers))
+        return gateway.call(key, send)
@@ -0,0 +1,159 @@
+import threading
+
+import numpy as np
+import pandas as pd
+from gspread.urls import SPREADSHEET_URL, SPREADSHEET_VALUES_BATCH_URL
+from gspread.utils import absolute_range_name, fill_gaps, numericise_all
+
+from perf import stage
+from sheet_cache import sheet_cache
+from sheets_client import get_client
+from snapshot_store import save_frames
+
+# Worksheets whose raw grid goes through summary_frame instead of records_frame
+SUMMARY_WORKSHEETS = {"Summary"}
+
+# Worksheet titles per spreadsheet, as (revision, titles), reused by later batches of that revision
+_titles = {}
+_titles_lock = threading.Lock()
+
+
+def worksheet_titles(client, sheet_id, refresh=False, revision=None):
+    """Return the worksheet titles of a spreadsheet, fetching metadata once per revision"""
+    with _titles_lock:
+        cached = _titles.get(sheet_id)
+        if not refresh and cached is not None and cached[0] == revision:
+            return cached[1]
+    params = {"fields": "sheets.properties.title"}
+    with stage("sheet_metadata"):
+        meta = client.request("get", SPREADSHEET_URL % sheet_id, params=params).json()
+    titles = [s["properties"]["title"] for s in meta.get("sheets", [])]
+    with _titles_lock:
+        _titles[sheet_id] = (revision, titles)
+    return titles
+
+
+def forget_titles(sheet_id=None):
+    """Drop cached worksheet titles for every spreadsheet, or only one"""
+    with _titles_lock:
+        if sheet_id is None:
+            _titles.clear()
+        else:
+            _titles.pop(sheet_id, None)
+
+
+# Clearing the worksheet cache (e.g. the Clear cached data button) forgets the titles too
+sheet_cache.on_invalidate(forget_titles)
+
+
+def fetch_values(client, sheet_id, worksheet_names, revision=None):
+    """Fetch the full value grid of several worksheets in one values:batchGet call.
+
+    Returns {worksheet name: list of rows}; worksheets missing from the
+    spreadsheet map to None.
+    """
+    titles = set(worksheet_titles(client, sheet_id, revision=revision))
+    if not titles.issuperset(worksheet_names):
+        # The tab may have been added or renamed since the titles were cached: look again
+        titles = set(worksheet_titles(client, sheet_id, refresh=True, revision=revision))
+    found = [name for name in worksheet_names if name in titles]
+    grids = {name: None for name in worksheet_names}
+    if not found:
+        return grids
+
+    params = {"ranges": [absolute_range_name(name) for name in found]}
+    with stage("sheet_values"):
+        body = client.request("get", SPREADSHEET_VALUES_BATCH_URL % sheet_id, params=params).json()
+    for name, value_range in zip(found, body.get("valueRanges", [])):
+        grids[name] = value_range.get("values", [])
+    return grids
+
+
+def records_frame(values):
+    """Build a DataFrame from a raw grid the same way get_all_records() would"""
+    if not values:
+        return pd.DataFrame()
+    header, rows = values[0], values[1:]
+    rows = fill_gaps(rows, cols=len(header)) if rows else []
+    rows = [numericise_all(row[:len(header)]) for row in rows]
+    return pd.DataFrame(rows, columns=header)
+
+
+def _dedupe_headers(headers):
+    # Blank headers get a positional name; repeats get pandas-style .1, .2 suffixes
+    seen, names = {}, []
+    for i, header in enumerate(headers):
+        name = str(header).strip() or f"Column {i + 1}"
+        count = seen.get(name, 0)
+        seen[name] = count + 1
+        names.append(name if count == 0 else f"{name}.{count}")
+    return names
+
+
+def normalize_grid(values):
+    """Turn a raw get_all_values() grid into a DataFrame of strings.
+
+    Ragged rows are padded, completely empty rows and columns are dropped and
+    duplicate or blank headers are made unique. Rows go into one object array
+    instead of being trimmed and padded cell by cell.
+    """
+    if not values:
+        return pd.DataFrame()
+    width = max(map(len, values))
+    pad = [''] * width
+    header = list(values[0]) + pad[len(values[0]):]
+    # Cells are strings, so a row is empty exactly when none of them is truthy
+    rows = [row if len(row) == width else list(row) + pad[len(row):] for row in values[1:] if any(row)]
+    grid = np.array(rows, dtype=object).reshape(len(rows), width)
+    keep = np.array([h != '' for h in header]) | (grid != '').any(axis=0)
+    return pd.DataFrame(grid if keep.all() else grid[:, keep],
+                        columns=_dedupe_headers([h for h, k in zip(header, keep) if k]))
+
+
+def numeric_column(column):
+    """column as numbers when every non-blank cell is one ("1,234" included), else unchanged"""
+    cells = column.astype(str)
+    blank = cells == ''
+    numbers = pd.to_numeric(cells.str.replace(',', '', regex=False).where(~blank), errors='coerce')
+    if (~blank).any() and numbers[~blank].notna().all():
+        return numbers
+    return column
+
+
+def summary_frame(values):
+    """Build the two-column Summary frame, avoiding duplicate column errors"""
+    if not values:
+        return pd.DataFrame(columns=['Summary Metric', 'Value'])
+    df = normalize_grid(values)
+
+    # For Summary sheet, only keep the first two columns to avoid duplicates
+    if len(df.columns) >= 2:
+        df = df.iloc[:, :2].set_axis(['Summary Metric', 'Value'], axis=1)
+        # Only the Value column is numeric; the rest stays text
+        df = df.assign(Value=numeric_column(df['Value']))
+    return df
+
+
+def load_worksheets(client, sheet_id, worksheet_names, revision=None):
+    """Load several worksheets of one spreadsheet as {name: DataFrame or None}"""
+    frames = {}
+    for name, values in fetch_values(client, sheet_id, worksheet_names, revision).items():
+        if values is None:
+            frames[name] = None
+        elif name in SUMMARY_WORKSHEETS:
+            with stage("summary_cleanup"):
+                frames[name] = summary_frame(values)
+        else:
+            with stage("records_frame"):
+                frames[name] = records_frame(values)
+    return frames
+
+
+def fetch_worksheets(sheet_id, worksheet_names, revision=None):
+    """Load worksheets with the pooled client and snapshot them to disk; None without credentials"""
+    client = get_client()
+    if client is None:
+        return None
+    frames = load_worksheets(client, sheet_id, worksheet_names, revision)
+    save_frames(sheet_id, frames, revision)
+    return frames
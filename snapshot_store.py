@@ -0,0 +1,108 @@
+import hashlib
+import json
+import os
+import time
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+except ImportError:  # the store is simply disabled without pyarrow
+    pa = None
+
+SNAPSHOT_DIR = os.environ.get("DASHBOARD_SNAPSHOT_DIR", ".snapshots")
+
+_META_KEY = b"dashboard_snapshot"
+
+
+def snapshot_path(source, name):
+    digest = hashlib.sha1(f"{source}\x00{name}".encode("utf-8")).hexdigest()[:20]
+    return os.path.join(SNAPSHOT_DIR, digest + ".arrow")
+
+
+def _to_table(df):
+    try:
+        return pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Sheets columns can mix numbers and '' blanks; store those as text
+        mixed = {c: df[c].astype(str) for c in df.columns if df[c].dtype == object}
+        return pa.Table.from_pandas(df.assign(**mixed), preserve_index=False)
+
+
+def save_snapshot(source, name, df, revision=None):
+    """Write df to an uncompressed Arrow IPC file with its revision metadata"""
+    if pa is None or df is None:
+        return False
+    meta = {"source": source, "name": name, "revision": revision, "saved_at": time.time()}
+    table = _to_table(df)
+    table = table.replace_schema_metadata({**(table.schema.metadata or {}), _META_KEY: json.dumps(meta)})
+
+    path = snapshot_path(source, name)
+    os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with pa.OSFile(tmp_path, "wb") as sink, ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+        os.replace(tmp_path, path)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return False
+    return True
+
+
+def load_snapshot(source, name):
+    """Memory-map a snapshot; returns (DataFrame, metadata) or (None, None)"""
+    path = snapshot_path(source, name)
+    if pa is None or not os.path.exists(path):
+        return None, None
+    try:
+        with pa.memory_map(path, "r") as source_file:
+            table = ipc.open_file(source_file).read_all()
+    except (OSError, pa.ArrowInvalid):
+        return None, None
+    meta = json.loads((table.schema.metadata or {}).get(_META_KEY, b"{}"))
+    return table.to_pandas(), meta
+
+
+def save_frames(sheet_id, frames, revision=None):
+    """Snapshot every loaded worksheet of a spreadsheet"""
+    for name, df in (frames or {}).items():
+        if df is not None:
+            save_snapshot(sheet_id, name, df, revision)
+
+
+def load_frames(sheet_id, worksheet_names):
+    """Return ({name: DataFrame}, metadata) when every worksheet has a snapshot"""
+    frames, metas = {}, []
+    for name in worksheet_names:
+        df, meta = load_snapshot(sheet_id, name)
+        if df is None:
+            return None, None
+        frames[name] = df
+        metas.append(meta)
+    # Only report a revision when all worksheets were saved from the same one
+    revisions = {m.get("revision") for m in metas}
+    meta = {
+        "revision": revisions.pop() if len(revisions) == 1 else None,
+        "saved_at": min(m.get("saved_at", 0) for m in metas) if metas else None,
+    }
+    return frames, meta
+
+
+def file_revision(path):
+    """Revision marker for a local file (size + mtime)"""
+    stat = os.stat(path)
+    return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def read_csv_snapshotted(path):
+    """Read a CSV, reusing its Arrow snapshot while the file is unchanged"""
+    revision = file_revision(path)
+    df, meta = load_snapshot("csv", path)
+    if df is not None and meta.get("revision") == revision:
+        return df
+    df = pd.read_csv(path)
+    save_snapshot("csv", path, df, revision)
+    return df
@@ -0,0 +1,155 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from perf import cache_lookup, stage
+
+PAGE_SIZES = (25, 50, 100, 250)
+DEFAULT_PAGE_SIZE = 50
+
+MAX_PAGERS = 8
+MAX_SLICES = 256
+
+_NO_SORT = "(table order)"
+
+
+def _sort_key(column):
+    """Sortable view of a column; blanks sort last.
+
+    Sheets columns come back as object columns mixing numbers and '' blanks,
+    which pandas can't sort. They sort numerically when most filled cells are
+    numbers, as text otherwise.
+    """
+    if column.dtype != object:
+        return column
+    blank = column.isna() | (column.astype(str).str.strip() == "")
+    numbers = pd.to_numeric(column.where(~blank), errors="coerce")
+    if numbers.notna().sum() * 2 > (~blank).sum():
+        return numbers
+    return column.astype(str).where(~blank)
+
+
+class TablePager:
+    """Server-side sort, page and column projection over one data version.
+
+    Only the requested page is ever handed to st.dataframe, so the browser
+    payload is bounded by the page size instead of the tracker size. Sort
+    ranks are computed once per column; sorted row orders and page slices
+    are cached per (filter, sort, page) key.
+    """
+
+    def __init__(self, df):
+        self.df = df
+        self._ranks = {}
+        self._slices = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _rank(self, column, ascending):
+        key = (column, ascending)
+        with self._lock:
+            if key in self._ranks:
+                return self._ranks[key]
+        order = (_sort_key(self.df[column].reset_index(drop=True))
+                 .sort_values(ascending=ascending, kind="stable", na_position="last").index.to_numpy())
+        rank = np.empty(len(order), dtype=np.int64)
+        rank[order] = np.arange(len(order))
+        with self._lock:
+            self._ranks[key] = rank
+        return rank
+
+    def _cached(self, key, build):
+        with self._lock:
+            value = self._slices.get(key)
+            if value is not None:
+                self._slices.move_to_end(key)
+        cache_lookup("table_page", value is not None)
+        if value is not None:
+            return value
+        value = build()
+        with self._lock:
+            self._slices[key] = value
+            while len(self._slices) > MAX_SLICES:
+                self._slices.popitem(last=False)
+        return value
+
+    def ordered(self, filter_key, rows, sort=None):
+        """Row positions of a filtered selection in display order; sort is (column, ascending)"""
+        if sort is None:
+            return rows
+
+        def build():
+            rank = self._rank(*sort)
+            return rows[np.argsort(rank[rows], kind="stable")]
+        return self._cached(("order", filter_key, sort), build)
+
+    def page(self, filter_key, rows, sort=None, page=1, page_size=DEFAULT_PAGE_SIZE, columns=None):
+        """The rows of one page, limited to the projected columns"""
+        columns = tuple(columns) if columns else None
+
+        def build():
+            start = (page - 1) * page_size
+            positions = self.ordered(filter_key, rows, sort)[start:start + page_size]
+            frame = self.df.iloc[positions]
+            return frame[list(columns)] if columns else frame
+        return self._cached(("page", filter_key, sort, page, page_size, columns), build)
+
+
+_pagers = OrderedDict()
+_pagers_lock = threading.Lock()
+
+
+def pager_for(version, df):
+    """TablePager for a data version, built once and shared by every session"""
+    with _pagers_lock:
+        pager = _pagers.get(version)
+        if pager is not None:
+            _pagers.move_to_end(version)
+            return pager
+    pager = TablePager(df)
+    with _pagers_lock:
+        _pagers[version] = pager
+        while len(_pagers) > MAX_PAGERS:
+            _pagers.popitem(last=False)
+    return pager
+
+
+def paginated_table(df, version, rows=None, filter_key=None, key="table"):
+    """Render sort / page / column controls and the current page of df"""
+    pager = pager_for(version, df)
+    if rows is None:
+        rows = np.arange(len(df))
+    columns = list(df.columns)
+
+    c1, c2, c3, c4 = st.columns([3, 2, 2, 2])
+    with c1:
+        shown = st.multiselect("Columns", options=columns, default=columns, key=f"{key}_columns")
+    with c2:
+        sort_col = st.selectbox("Sort by", options=[_NO_SORT] + columns, key=f"{key}_sort")
+        descending = st.checkbox("Descending", key=f"{key}_desc", disabled=sort_col == _NO_SORT)
+    with c3:
+        page_size = st.selectbox("Rows per page", options=PAGE_SIZES,
+                                 index=PAGE_SIZES.index(DEFAULT_PAGE_SIZE), key=f"{key}_page_size")
+    n_pages = max(1, -(-len(rows) // page_size))
+    # A narrower filter can leave the remembered page past the end
+    if st.session_state.get(f"{key}_page", 1) > n_pages:
+        st.session_state[f"{key}_page"] = n_pages
+    with c4:
+        page = st.number_input("Page", min_value=1, max_value=n_pages, step=1, key=f"{key}_page")
+
+    sort = None if sort_col == _NO_SORT else (sort_col, not descending)
+    page_df = pager.page(filter_key, rows, sort=sort, page=int(page), page_size=page_size,
+                         columns=[c for c in columns if c in shown] or None)
+    with stage("table_render"):
+        st.dataframe(page_df, use_container_width=True)
+
+    start = (int(page) - 1) * page_size
+    st.caption(f"Rows {min(start + 1, len(rows))}–{min(start + page_size, len(rows))} of {len(rows)} "
+               f"· page {int(page)} of {n_pages}")
+
+
+def forget_version(version):
+    with _pagers_lock:
+        _pagers.pop(version, None)
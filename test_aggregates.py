@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+
+from aggregates import AggregateEngine
+
+COL_MAP = {"pillar": "Pillar", "owner": "Owner", "status": "Status"}
+
+SELECTIONS = [
+    {},
+    {"pillars": ["Sales"]},
+    {"statuses": ["Completed", "In Progress"]},
+    {"pillars": ["Ops", "Finance"], "owners": ["COO", "MD"]},
+    {"pillars": ["Sales"], "statuses": ["Completed"], "owners": ["CFO"]},
+]
+
+
+def _tracker(n=500, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "Pillar": rng.choice(np.array(["Sales", "Ops", "Finance", None], dtype=object), n),
+        "Owner": rng.choice(["MD", "COO", "CFO"], n),
+        "Status": rng.choice(["Not Started", "In Progress", "Completed"], n),
+    })
+
+
+def _filtered(df, pillars=None, statuses=None, owners=None):
+    mask = pd.Series(True, index=df.index)
+    for column, selected in (("Pillar", pillars), ("Status", statuses), ("Owner", owners)):
+        if selected:
+            mask &= df[column].isin(selected)
+    return df[mask]
+
+
+def test_status_counts_match_value_counts():
+    df = _tracker()
+    engine = AggregateEngine.from_frame(df, COL_MAP)
+    for selection in SELECTIONS:
+        expected = _filtered(df, **selection)["Status"].value_counts()
+        got = engine.status_counts(**selection).set_index("Status")["Count"]
+        assert got.to_dict() == expected.to_dict(), selection
+        assert engine.total(**selection) == len(_filtered(df, **selection))
+
+
+def test_pairs_match_crosstab():
+    df = _tracker()
+    engine = AggregateEngine.from_frame(df, COL_MAP)
+    for selection in SELECTIONS:
+        rows = _filtered(df, **selection)
+        for method, column, label in ((engine.pillar_status, "Pillar", "Pillar"),
+                                      (engine.owner_status, "Owner", "Owner")):
+            expected = pd.crosstab(rows[column], rows["Status"]).stack()
+            expected = expected[expected > 0]
+            got = method(**selection).set_index([label, "Status"])["Count"]
+            assert got.to_dict() == expected.to_dict(), (selection, label)
+
+
+def test_pillar_summary_matches_crosstab():
+    df = _tracker()
+    summary = AggregateEngine.from_frame(df, COL_MAP).pillar_summary().set_index("Strategic Pillar")
+    expected = pd.crosstab(df["Pillar"], df["Status"])
+    assert summary["Completed"].to_dict() == expected["Completed"].to_dict()
+    assert summary["Total"].to_dict() == expected.sum(axis=1).to_dict()
+    assert summary.loc["Sales", "% Completed"] == round(
+        expected.loc["Sales", "Completed"] / expected.loc["Sales"].sum() * 100, 1)
@@ -0,0 +1,50 @@
+from change_detector import ChangeDetector
+
+
+class _Response:
+    def __init__(self, body):
+        self.body = body
+
+    def json(self):
+        return self.body
+
+
+class _Client:
+    """No Drive access; serves whole worksheets for values:batchGet"""
+
+    def __init__(self, grid):
+        self.grid = grid
+        self.requests = 0
+
+    def get_file_drive_metadata(self, sheet_id):
+        raise PermissionError("drive scope not granted")
+
+    def request(self, method, url, params=None):
+        self.requests += 1
+        return _Response({"valueRanges": [{"values": self.grid} for _ in params["ranges"]]})
+
+
+def test_content_hash_sees_edits_below_the_first_rows():
+    grid = [[f"row {i}", "Not Started"] for i in range(200)]
+    client, detector = _Client(grid), ChangeDetector(min_interval=0)
+    before = detector.check(client, "sheet", ["Tracker"])
+    grid[150][1] = "Completed"
+    assert detector.check(client, "sheet", ["Tracker"]) != before
+
+
+def test_checks_within_the_interval_reuse_the_revision():
+    client, detector = _Client([["a"]]), ChangeDetector(min_interval=60)
+    revision = detector.check(client, "sheet", ["Tracker"])
+    client.grid = [["b"]]
+    assert detector.check(client, "sheet", ["Tracker"]) == revision
+    assert client.requests == 1
+    assert detector.check(client, "sheet", ["Tracker"], force=True) != revision
+
+
+def test_state_is_a_snapshot():
+    client, detector = _Client([["a"]]), ChangeDetector(min_interval=0)
+    detector.check(client, "sheet", ["Tracker"])
+    state = detector.state("sheet")
+    client.grid = [["b"]]
+    detector.check(client, "sheet", ["Tracker"])
+    assert state.revision != detector.state("sheet").revision
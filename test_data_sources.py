@@ -0,0 +1,45 @@
+import pandas as pd
+import pytest
+
+import data_sources
+import snapshot_store
+from sheet_cache import SheetCache
+
+pytest.importorskip("pyarrow")
+
+SHEET_ID = "sheet-id"
+URL = f"https://docs.google.com/spreadsheets/d/{SHEET_ID}/edit"
+NAMES = ["Tracker"]
+LIVE = {"Tracker": pd.DataFrame({"Status": ["Completed", "In Progress"]})}
+
+
+@pytest.fixture
+def source(tmp_path, monkeypatch):
+    """GoogleSheetsSource whose sheet is at revision "r2", with a private cache and snapshot dir"""
+    monkeypatch.setattr(snapshot_store, "SNAPSHOT_DIR", str(tmp_path))
+    monkeypatch.setattr(data_sources, "sheet_cache", SheetCache())
+    monkeypatch.setattr(data_sources, "get_client", lambda: object())
+    monkeypatch.setattr(data_sources.change_detector, "check", lambda *args, **kwargs: "r2")
+    monkeypatch.setattr(data_sources, "load_worksheets", lambda *args: LIVE)
+    monkeypatch.setattr(data_sources, "fetch_worksheets", lambda *args: LIVE)
+    return data_sources.GoogleSheetsSource(URL, NAMES)
+
+
+def test_live_load_is_keyed_on_the_live_revision(source):
+    assert source.load() is LIVE
+    assert source.loaded_version() == source.version() == "r2"
+
+
+def test_stale_snapshot_is_keyed_on_its_own_revision(source):
+    snapshot_store.save_frames(SHEET_ID, {"Tracker": pd.DataFrame({"Status": ["Not Started"]})}, "r1")
+    frames = source.load()
+    assert frames["Tracker"]["Status"].tolist() == ["Not Started"]
+    assert source.version() == "r2"
+    assert source.loaded_version() == ("snapshot", "r1")
+
+
+def test_current_snapshot_is_keyed_on_the_live_revision(source):
+    snapshot_store.save_frames(SHEET_ID, LIVE, "r2")
+    frames = source.load()
+    assert frames["Tracker"]["Status"].tolist() == ["Completed", "In Progress"]
+    assert source.loaded_version() == "r2"
@@ -0,0 +1,61 @@
+import pytest
+
+import dataset_registry
+from dataset_registry import DatasetRegistry
+
+V1, V2 = ("sheet", "r1"), ("sheet", "r2")
+
+
+@pytest.fixture
+def forgotten(monkeypatch):
+    """Version keys whose per-version caches were cleared"""
+    keys = []
+    monkeypatch.setattr(dataset_registry, "_VERSION_CACHES", [keys.append])
+    return keys
+
+
+def test_sessions_share_one_dataset_per_version(forgotten):
+    registry, builds = DatasetRegistry(), []
+    build = lambda: builds.append(1) or object()
+    first = registry.acquire("s1", V1, build)
+    assert registry.acquire("s2", V1, build) is first
+    assert len(builds) == 1
+    assert registry.stats() == {"datasets": 1, "sessions": 2, "refs": {V1: 2}}
+
+
+def test_old_version_evicted_when_no_session_holds_it(forgotten):
+    registry = DatasetRegistry()
+    registry.acquire("s1", V1, object)
+    registry.acquire("s2", V1, object)
+    registry.acquire("s1", V2, object)
+    # s2 still views r1
+    assert forgotten == []
+    registry.acquire("s2", V2, object)
+    assert forgotten == [V1]
+    assert registry.stats()["datasets"] == 1
+
+
+def test_latest_version_kept_without_sessions(forgotten):
+    registry = DatasetRegistry()
+    registry.acquire("s1", V1, object)
+    registry.release("s1")
+    assert forgotten == []
+    registry.acquire(None, V2, object)
+    assert forgotten == [V1]
+    assert registry.stats() == {"datasets": 1, "sessions": 0, "refs": {}}
+
+
+def test_expired_sessions_stop_holding_their_version(forgotten):
+    registry = DatasetRegistry(session_ttl=-1)
+    registry.acquire("s1", V1, object)
+    registry.acquire("s2", V2, object)
+    assert forgotten == [V1]
+
+
+def test_sources_are_tracked_separately(forgotten):
+    registry = DatasetRegistry()
+    registry.acquire("s1", ("a", 1), object)
+    registry.release("s1")
+    registry.acquire("s2", ("b", 1), object)
+    assert forgotten == []
+    assert registry.stats()["datasets"] == 2
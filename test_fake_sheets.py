@@ -0,0 +1,71 @@
+import os
+
+import pytest
+from gspread.urls import DRIVE_FILES_API_V3_URL, SPREADSHEET_URL, SPREADSHEET_VALUES_BATCH_URL
+
+import fake_sheets
+from fake_sheets import FakeSheetsSession
+
+SHEET_ID = "sheet-id"
+
+
+@pytest.fixture
+def root(tmp_path):
+    sheet_dir = tmp_path / SHEET_ID
+    sheet_dir.mkdir()
+    (sheet_dir / "Tracker.csv").write_text("Status,Owner,\nCompleted,MD,\n,,\n")
+    (sheet_dir / "Summary.csv").write_text("Summary Metric,Value\nTotal,2\n")
+    # An old edit, so only revision_every can move the revision
+    for name in ("Tracker.csv", "Summary.csv"):
+        os.utime(sheet_dir / name, (1_000_000, 1_000_000))
+    return str(tmp_path)
+
+
+def _revision(session):
+    return session.get(f"{DRIVE_FILES_API_V3_URL}/{SHEET_ID}").json()["modifiedTime"]
+
+
+def test_batch_get_trims_like_sheets(root):
+    body = FakeSheetsSession(root).get(SPREADSHEET_VALUES_BATCH_URL % SHEET_ID,
+                                       params={"ranges": ["'Tracker'", "'Summary'!A1:B1"]}).json()
+    assert [r["values"] for r in body["valueRanges"]] == [[["Status", "Owner"], ["Completed", "MD"]],
+                                                          [["Summary Metric", "Value"]]]
+
+
+def test_metadata_lists_worksheets(root):
+    body = FakeSheetsSession(root).get(SPREADSHEET_URL % SHEET_ID).json()
+    assert [s["properties"]["title"] for s in body["sheets"]] == ["Summary", "Tracker"]
+
+
+def test_quota_answers_429_once_used_up(root):
+    session = FakeSheetsSession(root, quota_per_minute=2)
+    statuses = [session.get(SPREADSHEET_URL % SHEET_ID).status_code for _ in range(3)]
+    assert statuses == [200, 200, 429]
+    assert session.stats()["throttled"] == 1
+
+
+def test_random_throttling(root):
+    assert FakeSheetsSession(root, throttle_rate=1).get(SPREADSHEET_URL % SHEET_ID).status_code == 429
+    assert FakeSheetsSession(root, throttle_rate=0).get(SPREADSHEET_URL % SHEET_ID).status_code == 200
+
+
+def test_revision_moves_every_revision_every_seconds(root, monkeypatch):
+    session = FakeSheetsSession(root, revision_every=60)
+    monkeypatch.setattr(fake_sheets.time, "time", lambda: 1_700_000_045.0)
+    first = _revision(session)
+    monkeypatch.setattr(fake_sheets.time, "time", lambda: 1_700_000_095.0)
+    assert _revision(session) == first
+    monkeypatch.setattr(fake_sheets.time, "time", lambda: 1_700_000_105.0)
+    assert _revision(session) > first
+
+
+def test_revision_fixed_without_edits(root):
+    session = FakeSheetsSession(root)
+    first = _revision(session)
+    assert _revision(session) == first
+    session.touch(SHEET_ID)
+    assert _revision(session) > first
+
+
+def test_read_only(root):
+    assert FakeSheetsSession(root).post(SPREADSHEET_URL % SHEET_ID).status_code == 403
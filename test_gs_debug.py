@@ -3,6 +3,7 @@ import pandas as pd
 import gspread
 from google.oauth2.service_account import Credentials
 import os
+from sheets_loader import normalize_grid, summary_frame
 
 st.title("🔍 Google Sheets Debug Test")
 
@@ -42,36 +43,13 @@ def load_google_sheet(sheet_url, worksheet_name):
             all_values = worksheet.get_all_values()
             st.write(f"Got {len(all_values)} rows from Summary sheet")
             
-            # Clean empty cells and ensure consistent structure
-            cleaned_values = []
-            max_cols = 0
-            
-            for row in all_values:
-                # Remove empty cells from the end
-                while row and row[-1] == '':
-                    row = row[:-1]
-                cleaned_values.append(row)
-                max_cols = max(max_cols, len(row))
-            
-            # Pad rows to ensure consistent column count
-            for i, row in enumerate(cleaned_values):
-                while len(row) < max_cols:
-                    row.append('')
-                cleaned_values[i] = row
-            
-            # Create DataFrame
-            df = pd.DataFrame(cleaned_values[1:], columns=cleaned_values[0])
-            st.write(f"Created DataFrame with {len(df)} rows and {len(df.columns)} columns")
-            
-            # Remove completely empty rows and columns
-            df = df.dropna(axis=1, how='all')
-            df = df.dropna(axis=0, how='all')
-            st.write(f"After cleaning: {len(df)} rows and {len(df.columns)} columns")
+            # Pad, drop empty rows/columns and de-duplicate headers in one pass
+            grid = normalize_grid(all_values)
+            st.write(f"After cleaning: {len(grid)} rows and {len(grid.columns)} columns")
             
             # For Summary sheet, only keep the first two columns to avoid duplicates
-            if len(df.columns) >= 2:
-                df = df.iloc[:, :2]
-                df.columns = ['Summary Metric', 'Value']
+            df = summary_frame(all_values)
+            if list(df.columns) == ['Summary Metric', 'Value']:
                 st.write("✅ Summary sheet processed successfully")
             
         else:
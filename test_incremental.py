@@ -0,0 +1,42 @@
+import pandas as pd
+
+from incremental import DerivedCounts, IncrementalTracker, diff_frames
+
+COL_MAP = {"pillar": "Pillar", "metric": "KPI", "owner": "Owner", "status": "Status"}
+
+
+def _frame(rows):
+    return pd.DataFrame(rows, columns=["Pillar", "KPI", "Owner", "Status"])
+
+
+OLD = _frame([
+    ("Sales", "Pipeline", "MD", "Not Started"),
+    ("Sales", "Pipeline", "COO", "In Progress"),
+    ("Ops", "Vendors", "COO", "Completed"),
+])
+NEW = _frame([
+    ("Sales", "Pipeline", "MD", "Completed"),
+    ("Sales", "Pipeline", "COO", "In Progress"),
+    ("Ops", "Buyers", "CFO", "Not Started"),
+])
+
+
+def test_diff_frames():
+    diff = diff_frames(OLD, NEW, ["Pillar", "KPI"])
+    assert (len(diff.added), len(diff.removed), len(diff.changed_new)) == (1, 1, 1)
+    assert not diff_frames(OLD, OLD, ["Pillar", "KPI"])
+
+
+def test_ingest_applies_deltas_like_a_rebuild():
+    tracker = IncrementalTracker()
+    tracker.ingest("sheet", "r1", OLD, COL_MAP)
+    engine = tracker.ingest("sheet", "r2", NEW, COL_MAP)
+    assert tracker.last_diff("sheet")
+    assert engine.cube == DerivedCounts.from_frame(NEW, COL_MAP).cube
+    assert engine.status_count("Completed") == 1
+
+
+def test_ingest_same_version_reuses_counts():
+    tracker = IncrementalTracker()
+    first = tracker.ingest("sheet", "r1", OLD, COL_MAP)
+    assert tracker.ingest("sheet", "r1", NEW, COL_MAP) is first
@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+
+from filter_index import FilterIndex
+from owner_index import OwnerIndex, split_owners
+
+COL_MAP = {"pillar": "Pillar", "status": "Status", "owner": "Owner"}
+OWNERS = ["MD", "COO", "MD,COO, Head Sourcing", "COO / CFO", "cfo", "R&D Lead", None]
+
+
+def _tracker(n=400, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "Pillar": rng.choice(["Sales", "Ops", "Finance", None], n),
+        "Status": rng.choice(["Not Started", "In Progress", "Completed"], n),
+        "Owner": rng.choice(np.array(OWNERS, dtype=object), n),
+    })
+
+
+def _owner_sets(df):
+    """Reference: the casefolded owners each row names"""
+    return df["Owner"].map(lambda v: {o.casefold() for o in split_owners(v)})
+
+
+def test_split_owners_on_list_separators():
+    assert split_owners("MD,COO, Head Sourcing") == ("MD", "COO", "Head Sourcing")
+    assert split_owners("COO/CFO") == ("COO", "CFO")
+    assert split_owners("COO / CFO;\nMD") == ("COO", "CFO", "MD")
+
+
+def test_split_owners_keeps_names_with_and():
+    assert split_owners("R&D Lead") == ("R&D Lead",)
+    assert split_owners("Sales and Marketing Head") == ("Sales and Marketing Head",)
+    assert split_owners(None) == ()
+
+
+def test_owner_rows_match_pandas():
+    df = _tracker()
+    index = OwnerIndex(df, COL_MAP)
+    owner_sets = _owner_sets(df)
+    # "CFO" and "cfo" are one owner
+    assert sorted(o.casefold() for o in index.owners) == ["cfo", "coo", "head sourcing", "md", "r&d lead"]
+    for owner in index.owners:
+        expected = np.flatnonzero(owner_sets.map(lambda s: owner.casefold() in s))
+        assert index.rows[owner].tolist() == expected.tolist()
+
+
+def test_workload_matches_pandas():
+    df = _tracker()
+    index = OwnerIndex(df, COL_MAP)
+    owner_status = df.groupby(["Owner", "Status"]).size().rename("Count").reset_index()
+    canonical = {o.casefold(): o for o in index.owners}
+    exploded = df.assign(Owner=_owner_sets(df).map(lambda s: [canonical[o] for o in s])).explode("Owner")
+    expected = exploded.dropna(subset=["Owner"]).groupby(["Owner", "Status"]).size()
+    got = index.workload(owner_status).set_index(["Owner", "Status"])["Count"]
+    assert got.to_dict() == expected.to_dict()
+
+
+def test_filter_index_matches_pandas():
+    df = _tracker()
+    owners = OwnerIndex(df, COL_MAP)
+    index = FilterIndex(df, COL_MAP, owner_index=owners)
+    owner_sets = _owner_sets(df)
+    # Whichever of "CFO" / "cfo" came first is the owner's name
+    cfo = next(o for o in owners.owners if o.casefold() == "cfo")
+    selections = [
+        ({}, np.ones(len(df), dtype=bool)),
+        ({"pillars": ["Sales"]}, df["Pillar"].eq("Sales")),
+        ({"statuses": ["Completed", "In Progress"]}, df["Status"].isin(["Completed", "In Progress"])),
+        ({"owners": ["MD"]}, owner_sets.map(lambda s: "md" in s)),
+        ({"pillars": ["Ops", "Finance"], "owners": [cfo, "R&D Lead"]},
+         df["Pillar"].isin(["Ops", "Finance"]) & owner_sets.map(lambda s: bool(s & {"cfo", "r&d lead"}))),
+        # Selecting every value still drops blank rows
+        ({"pillars": ["Sales", "Ops", "Finance"]}, df["Pillar"].notna()),
+    ]
+    for selection, expected in selections:
+        assert index.select(**selection).tolist() == np.flatnonzero(expected).tolist(), selection
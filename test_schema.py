@@ -0,0 +1,38 @@
+import pandas as pd
+
+from schema import TrackerSchema
+
+DF = pd.DataFrame({
+    "Strategic Pillar": ["Sales", "Sales", "Ops", "Ops"],
+    "Max out Target TAT": ["≥ 30 meetings in 90 -120 days", "30–50 SKUs/category", "≥ 50% by Q4 FY26", None],
+    "Frequency": ["Day 30", "Monthly", "Quarterly", None],
+    "Status": ["Not Started", "Completed", "In Progress", "Completed"],
+})
+
+
+def test_parsed_fields_are_built_on_first_use():
+    schema = TrackerSchema(DF)
+    assert "targets" not in vars(schema) and "frequencies" not in vars(schema)
+    assert schema.targets is schema.targets
+    assert isinstance(schema.df["Max out Target TAT"].dtype, pd.CategoricalDtype)
+
+
+def test_targets():
+    targets = TrackerSchema(DF).targets
+    assert targets["comparator"].fillna("").tolist() == ["≥", "", "≥", ""]
+    assert targets["low"].tolist()[:3] == [30.0, 30.0, 50.0]
+    assert targets["high"].tolist()[1] == 50.0
+    assert targets.loc[2, ["unit", "quarter", "fiscal_year"]].tolist() == ["%", "Q4", 26.0]
+    assert targets.loc[3].isna().all()
+
+
+def test_frequencies():
+    frequencies = TrackerSchema(DF).frequencies
+    assert frequencies["period"].tolist()[:3] == ["day", "monthly", "quarterly"]
+    assert frequencies["days"].tolist()[:3] == [30.0, 30.0, 91.0]
+    assert frequencies.loc[3].isna().all()
+
+
+def test_missing_columns_parse_to_none():
+    schema = TrackerSchema(DF[["Strategic Pillar", "Status"]])
+    assert schema.targets is None and schema.frequencies is None
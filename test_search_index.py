@@ -0,0 +1,51 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+from search_index import SearchIndex
+
+COL_MAP = {"metric": "KPI / Metric", "action": "Action Items"}
+
+DF = pd.DataFrame({
+    "KPI / Metric": ["Buyer pilot  meetings", "Vendor onboarding", "Target list of buyers", None,
+                     "Pilots closed (Q2 FY26)", "EBITDA ≤ 3×", "Café  Partnerships"],
+    "Action Items": ["Schedule pilot calls", None, "Share target list", "Vendor audit",
+                     "Close pilot", "Review costs", "Sign café deals"],
+})
+
+
+def _reference(query):
+    """Every whitespace-separated term must match the metric or action text"""
+    fields = DF[list(COL_MAP.values())].fillna("").astype(str).apply(
+        lambda column: column.map(lambda t: " ".join(t.casefold().split())))
+    text = fields.agg("\x1f".join, axis=1)
+    mask = pd.Series(True, index=DF.index)
+    for term in query.casefold().split():
+        if term.endswith("*") and len(term) > 1:
+            mask &= text.str.contains(r"(?<!\w)" + re.escape(term[:-1]), regex=True)
+        else:
+            mask &= text.str.contains(term, regex=False)
+    return np.flatnonzero(mask).tolist()
+
+
+def test_search_matches_pandas():
+    index = SearchIndex(DF, COL_MAP)
+    queries = ["pilot", "PILOT  calls", "buy", "buyer*", "uyer*", "pil* close", "list target",
+               "vendor", "q2 fy26", "≤", "café", "cafe", "zzz", "ta", "a",
+               "|", " | ", "calls sched", "meetings schedule"]
+    for query in queries:
+        assert index.search(query).tolist() == _reference(query), query
+
+
+def test_pipe_does_not_match_between_fields():
+    assert SearchIndex(DF, COL_MAP).search("|").tolist() == []
+
+
+def test_empty_query_returns_every_row():
+    assert SearchIndex(DF, COL_MAP).search("  ").tolist() == list(range(len(DF)))
+
+
+def test_repeated_query_is_cached():
+    index = SearchIndex(DF, COL_MAP)
+    assert index.search("Pilot") is index.search("pilot")
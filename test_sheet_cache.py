@@ -0,0 +1,87 @@
+import threading
+import time
+
+from sheet_cache import SheetCache
+
+NAMES = ("Tracker", "Summary")
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+def test_loads_once_per_revision():
+    cache, calls = SheetCache(), []
+    load = lambda: calls.append(1) or "frames"
+    assert cache.get(("sheet", NAMES, "r1"), load) == "frames"
+    assert cache.get(("sheet", NAMES, "r1"), load) == "frames"
+    assert len(calls) == 1
+    assert ("sheet", NAMES, "r2") not in cache
+    cache.get(("sheet", NAMES, "r2"), load)
+    assert len(calls) == 2
+
+
+def test_failed_loads_are_not_cached():
+    cache = SheetCache()
+    assert cache.get(("sheet", NAMES, "r1"), lambda: None) is None
+    assert ("sheet", NAMES, "r1") not in cache
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = SheetCache(max_entries=2)
+    cache.put(("a", NAMES, 1), "a")
+    cache.put(("b", NAMES, 1), "b")
+    cache.get(("a", NAMES, 1), lambda: None)
+    cache.put(("c", NAMES, 1), "c")
+    assert ("a", NAMES, 1) in cache and ("c", NAMES, 1) in cache
+    assert ("b", NAMES, 1) not in cache
+
+
+def test_expired_entry_is_served_while_it_refreshes():
+    cache = SheetCache(ttl=0)
+    key = ("sheet", NAMES, "r1")
+    cache.put(key, "old")
+    assert cache.get(key, lambda: "new") == "old"
+    assert _wait_for(lambda: cache.get(key, lambda: "new") == "new")
+
+
+def test_invalidate_one_sheet():
+    cache = SheetCache()
+    cache.put(("a", NAMES, 1), "a")
+    cache.put(("b", NAMES, 1), "b")
+    cache.invalidate("a")
+    assert ("a", NAMES, 1) not in cache and ("b", NAMES, 1) in cache
+    cache.invalidate()
+    assert len(cache) == 0
+
+
+def test_failed_refresh_keeps_the_old_entry():
+    cache, attempts = SheetCache(ttl=0), []
+    key = ("sheet", NAMES, "r1")
+    cache.put(key, "old")
+
+    def fail():
+        attempts.append(1)
+        raise ConnectionError("429")
+    assert cache.get(key, fail) == "old"
+    assert _wait_for(lambda: attempts and key not in cache._refreshing)
+    assert cache.get(key, lambda: "new") == "old"
+    assert _wait_for(lambda: cache.get(key, lambda: "new") == "new")
+
+
+def test_refresh_started_before_invalidate_is_dropped():
+    cache, release = SheetCache(ttl=0), threading.Event()
+    key = ("sheet", NAMES, "r1")
+    cache.put(key, "old")
+
+    def slow():
+        release.wait(2)
+        return "stale"
+    cache.get(key, slow)
+    cache.invalidate("sheet")
+    release.set()
+    time.sleep(0.1)
+    assert key not in cache
@@ -0,0 +1,106 @@
+import threading
+import time
+
+import pytest
+import requests
+from gspread.exceptions import APIError
+
+import sheets_gateway
+from sheets_gateway import SheetsGateway, TokenBucket
+
+
+def _api_error(status, retry_after=None):
+    response = requests.Response()
+    response.status_code = status
+    response._content = b'{"error": {"code": %d, "message": "quota", "status": "RESOURCE_EXHAUSTED"}}' % status
+    if retry_after is not None:
+        response.headers["Retry-After"] = retry_after
+    return APIError(response)
+
+
+class _Flaky:
+    """send() that fails with the given errors before succeeding"""
+
+    def __init__(self, *errors):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return "ok"
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Backoff delays, recorded instead of slept"""
+    delays = []
+    monkeypatch.setattr(sheets_gateway.time, "sleep", delays.append)
+    return delays
+
+
+def test_token_bucket_allows_a_burst_then_waits():
+    bucket = TokenBucket(rate=20, capacity=2)
+    assert bucket.acquire() == 0 and bucket.acquire() == 0
+    start = time.monotonic()
+    assert bucket.acquire() > 0
+    assert time.monotonic() - start >= 0.04
+
+
+def test_429_honours_retry_after(sleeps):
+    gateway = SheetsGateway(rate_per_minute=6000, burst=10)
+    send = _Flaky(_api_error(429, retry_after="7"))
+    assert gateway.call(None, send) == "ok"
+    assert sleeps == [7.0]
+    stats = gateway.stats()
+    assert (stats["requests"], stats["retries"], stats["throttled"], stats["errors"]) == (2, 1, 1, 0)
+
+
+def test_429_without_retry_after_backs_off_exponentially(sleeps):
+    gateway = SheetsGateway(rate_per_minute=6000, burst=10)
+    send = _Flaky(_api_error(429), _api_error(503), _api_error(429))
+    assert gateway.call(None, send) == "ok"
+    # Base delays 1, 2, 4 s with 50-100% jitter
+    for attempt, delay in enumerate(sleeps):
+        assert 2 ** attempt / 2 <= delay <= 2 ** attempt
+
+
+def test_gives_up_after_max_retries(sleeps):
+    gateway = SheetsGateway(rate_per_minute=6000, burst=10, max_retries=2)
+    send = _Flaky(*[_api_error(429) for _ in range(3)])
+    with pytest.raises(APIError):
+        gateway.call(None, send)
+    assert send.calls == 3 and gateway.stats()["errors"] == 1
+
+
+def test_client_errors_are_not_retried(sleeps):
+    gateway = SheetsGateway(rate_per_minute=6000, burst=10)
+    send = _Flaky(_api_error(404))
+    with pytest.raises(APIError):
+        gateway.call(None, send)
+    assert send.calls == 1 and sleeps == []
+
+
+def test_concurrent_identical_gets_share_one_request():
+    gateway, release, sent = SheetsGateway(rate_per_minute=6000, burst=10), threading.Event(), []
+
+    def send():
+        sent.append(1)
+        release.wait(2)
+        return object()
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(gateway.call("key", send))) for _ in range(4)]
+    threads[0].start()
+    while not sent:
+        time.sleep(0.001)
+    for thread in threads[1:]:
+        thread.start()
+    while gateway.stats()["coalesced"] < 3:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert len(sent) == 1
+    assert len(results) == 4 and all(result is results[0] for result in results)
@@ -0,0 +1,73 @@
+from sheet_cache import sheet_cache
+from sheets_loader import fetch_values, forget_titles, normalize_grid, summary_frame, worksheet_titles
+
+
+class _Response:
+    def __init__(self, body):
+        self.body = body
+
+    def json(self):
+        return self.body
+
+
+class _Client:
+    """Answers the metadata and values:batchGet requests from a dict of grids"""
+
+    def __init__(self, grids):
+        self.grids = grids
+        self.metadata_requests = 0
+
+    def request(self, method, url, params=None):
+        if "values:batchGet" in url:
+            return _Response({"valueRanges": [{"values": self.grids[r.strip("'")]} for r in params["ranges"]]})
+        self.metadata_requests += 1
+        return _Response({"sheets": [{"properties": {"title": name}} for name in self.grids]})
+
+
+def test_normalize_grid_pads_and_drops_empty_rows_and_columns():
+    grid = [["Name", "", "Name", ""], ["a", "", "1"], ["", "", "", ""], ["b", "", "", "x"]]
+    df = normalize_grid(grid)
+    assert list(df.columns) == ["Name", "Name.1", "Column 3"]
+    assert df.values.tolist() == [["a", "1", ""], ["b", "", "x"]]
+
+
+def test_normalize_grid_keeps_text():
+    df = normalize_grid([["Count"], ["1,234"], ["7"]])
+    assert df["Count"].tolist() == ["1,234", "7"]
+
+
+def test_summary_frame_columns_and_numeric_value():
+    df = summary_frame([["Summary Metric", "Value", "Notes"], ["Total Deliverables", "1,234", "x"], ["% Completed", "8.0"]])
+    assert list(df.columns) == ["Summary Metric", "Value"]
+    assert df["Value"].tolist() == [1234, 8.0]
+
+
+def test_summary_frame_empty():
+    assert list(summary_frame([]).columns) == ["Summary Metric", "Value"]
+
+
+def test_worksheet_titles_cached_per_revision():
+    forget_titles()
+    client = _Client({"Tracker": [["A"]]})
+    worksheet_titles(client, "sheet", revision="r1")
+    worksheet_titles(client, "sheet", revision="r1")
+    assert client.metadata_requests == 1
+    worksheet_titles(client, "sheet", revision="r2")
+    assert client.metadata_requests == 2
+
+
+def test_fetch_values_looks_again_for_a_new_worksheet():
+    forget_titles()
+    client = _Client({"Tracker": [["A"], ["1"]]})
+    assert fetch_values(client, "sheet", ["Tracker", "Summary"]) == {"Tracker": [["A"], ["1"]], "Summary": None}
+    client.grids["Summary"] = [["Metric", "Value"]]
+    assert fetch_values(client, "sheet", ["Summary"]) == {"Summary": [["Metric", "Value"]]}
+
+
+def test_sheet_cache_invalidate_forgets_titles():
+    forget_titles()
+    client = _Client({"Tracker": [["A"]]})
+    worksheet_titles(client, "sheet")
+    sheet_cache.invalidate("sheet")
+    worksheet_titles(client, "sheet")
+    assert client.metadata_requests == 2
@@ -3,6 +3,7 @@ import pandas as pd
 import gspread
 from google.oauth2.service_account import Credentials
 import os
+from sheets_loader import summary_frame
 
 st.title("🔍 Simple Google Sheets Test")
 
@@ -23,27 +24,7 @@ def load_google_sheet_simple(sheet_url, worksheet_name):
         
         if worksheet_name == "Summary":
             all_values = worksheet.get_all_values()
-            cleaned_values = []
-            max_cols = 0
-            
-            for row in all_values:
-                while row and row[-1] == '':
-                    row = row[:-1]
-                cleaned_values.append(row)
-                max_cols = max(max_cols, len(row))
-            
-            for i, row in enumerate(cleaned_values):
-                while len(row) < max_cols:
-                    row.append('')
-                cleaned_values[i] = row
-            
-            df = pd.DataFrame(cleaned_values[1:], columns=cleaned_values[0])
-            df = df.dropna(axis=1, how='all')
-            df = df.dropna(axis=0, how='all')
-            
-            if len(df.columns) >= 2:
-                df = df.iloc[:, :2]
-                df.columns = ['Summary Metric', 'Value']
+            df = summary_frame(all_values)
         else:
             all_records = worksheet.get_all_records()
             df = pd.DataFrame(all_records)
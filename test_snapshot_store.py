@@ -0,0 +1,46 @@
+import pandas as pd
+import pytest
+
+import snapshot_store
+
+pytest.importorskip("pyarrow")
+
+
+@pytest.fixture(autouse=True)
+def snapshot_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(snapshot_store, "SNAPSHOT_DIR", str(tmp_path))
+    return tmp_path
+
+
+def test_snapshot_round_trip_keeps_revision():
+    df = pd.DataFrame({"Status": ["Completed", "In Progress"], "Count": [1, ""]})
+    assert snapshot_store.save_snapshot("sheet", "Tracker", df, revision="r1")
+    loaded, meta = snapshot_store.load_snapshot("sheet", "Tracker")
+    assert loaded["Status"].tolist() == ["Completed", "In Progress"]
+    # Mixed numbers and blanks come back as text
+    assert loaded["Count"].tolist() == ["1", ""]
+    assert meta["revision"] == "r1"
+
+
+def test_load_frames_needs_every_worksheet():
+    df = pd.DataFrame({"a": [1]})
+    snapshot_store.save_frames("sheet", {"Tracker": df, "Summary": None}, revision="r1")
+    assert snapshot_store.load_frames("sheet", ["Tracker", "Summary"]) == (None, None)
+    frames, meta = snapshot_store.load_frames("sheet", ["Tracker"])
+    assert list(frames) == ["Tracker"] and meta["revision"] == "r1"
+
+
+def test_load_frames_drops_mixed_revisions():
+    df = pd.DataFrame({"a": [1]})
+    snapshot_store.save_snapshot("sheet", "Tracker", df, revision="r1")
+    snapshot_store.save_snapshot("sheet", "Summary", df, revision="r2")
+    _, meta = snapshot_store.load_frames("sheet", ["Tracker", "Summary"])
+    assert meta["revision"] is None
+
+
+def test_csv_snapshot_follows_the_file(tmp_path):
+    path = tmp_path / "tracker.csv"
+    path.write_text("a\n1\n")
+    assert snapshot_store.read_csv_snapshotted(str(path))["a"].tolist() == [1]
+    path.write_text("a\n1\n2\n")
+    assert snapshot_store.read_csv_snapshotted(str(path))["a"].tolist() == [1, 2]
@@ -0,0 +1,29 @@
+import numpy as np
+import pandas as pd
+
+from table_pager import TablePager
+
+
+def _sorted(df, column, ascending=True):
+    pager = TablePager(df)
+    return pager.page("all", np.arange(len(df)), sort=(column, ascending), page_size=25)[column].tolist()
+
+
+def test_sort_numbers_with_blanks():
+    df = pd.DataFrame({"n": [5, "", 7, 1]}, dtype=object)
+    assert _sorted(df, "n") == [1, 5, 7, ""]
+    assert _sorted(df, "n", ascending=False) == [7, 5, 1, ""]
+
+
+def test_sort_text_mixed_with_numbers():
+    df = pd.DataFrame({"t": ["b", 3, "", "a"]}, dtype=object)
+    assert _sorted(df, "t") == [3, "a", "b", ""]
+
+
+def test_sort_plain_column_and_paging():
+    df = pd.DataFrame({"x": [3, 1, 2, 5, 4]})
+    pager = TablePager(df)
+    rows = np.array([0, 1, 3, 4])  # filtered selection
+    page = pager.page("f", rows, sort=("x", True), page=2, page_size=2)
+    assert page["x"].tolist() == [4, 5]
+    assert pager.page("f", rows, page=1, page_size=3, columns=["x"]).index.tolist() == [0, 1, 3]